@@ -146,6 +146,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Unsubscribe from entity state change tracking
         if hasattr(coordinator, "_entity_unsub") and coordinator._entity_unsub:
             coordinator._entity_unsub()
+        if getattr(coordinator, "_pending_refresh_unsub", None):
+            coordinator._pending_refresh_unsub()
         await async_remove_dashboard(hass, entry)
 
     return unload_ok
@@ -32,7 +32,7 @@ from .const import (
     DEFAULT_MAX_GRID_POWER,
     DEFAULT_SUNNY_FORECAST_THRESHOLD_KWH,
 )
-from .helpers import coerce_integral_range, resolve_local_deadline
+from .helpers import coerce_integral_range, isoformat_local, resolve_local_deadline
 
 if TYPE_CHECKING:
     from .coordinator import ElectricityPlannerCoordinator
@@ -217,9 +217,6 @@ class ArbitrageModePlanner:
         """Select eligible export slots and decorate the plan with status/reason."""
         coordinator = self._coordinator
 
-        def _iso_local(dt_obj: datetime) -> str:
-            return dt_util.as_local(dt_obj).isoformat()
-
         now = dt_util.utcnow()
         timeline = coordinator._build_feedin_price_timeline(
             data.get("nordpool_prices_today"),
@@ -241,7 +238,7 @@ class ArbitrageModePlanner:
             )
         )
         deadline = self.deadline(now)
-        plan["deadline"] = _iso_local(deadline)
+        plan["deadline"] = isoformat_local(deadline)
         slot_selection = coordinator._select_export_slots(
             timeline,
             now,
@@ -259,8 +256,8 @@ class ArbitrageModePlanner:
         selected_slots = slot_selection.get("selected_slots", [])
         plan["selected_slots"] = [
             {
-                "start": _iso_local(slot["start"]),
-                "end": _iso_local(slot["end"]),
+                "start": isoformat_local(slot["start"]),
+                "end": isoformat_local(slot["end"]),
                 "price": round(slot["price"], 4),
             }
             for slot in selected_slots
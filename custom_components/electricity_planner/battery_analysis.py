@@ -34,25 +34,24 @@ class BatteryAnalysisCalculator:
         if not battery_soc_data:
             return self._create_no_battery_result()
 
-        # Filter valid batteries
-        valid_batteries = [
-            battery
-            for battery in battery_soc_data
-            if "soc" in battery
-            and battery["soc"] is not None
-            and 0 <= battery["soc"] <= 100
-        ]
-
-        if not valid_batteries:
+        # Filter valid batteries into parallel id/SOC columns in one pass
+        entity_ids: list[str] = []
+        soc_values: list[float] = []
+        for battery in battery_soc_data:
+            soc = battery.get("soc")
+            if soc is not None and 0 <= soc <= 100:
+                entity_ids.append(battery.get("entity_id"))
+                soc_values.append(soc)
+
+        if not soc_values:
             return self._create_unavailable_battery_result(len(battery_soc_data))
 
         # Calculate metrics
-        soc_values = [battery["soc"] for battery in valid_batteries]
         min_soc = min(soc_values)
         max_soc = max(soc_values)
 
         # Calculate weighted average if capacities configured
-        average_soc = self.calculate_weighted_average_soc(valid_batteries)
+        average_soc = self._weighted_average(entity_ids, soc_values)
 
         min_threshold = self._settings.min_soc_threshold
         max_threshold = self._settings.max_soc_threshold
@@ -79,39 +78,45 @@ class BatteryAnalysisCalculator:
             )
             return 0.0
 
+        return self._weighted_average(
+            [battery["entity_id"] for battery in batteries],
+            [battery["soc"] for battery in batteries],
+        )
+
+    def _weighted_average(self, entity_ids: list[str], socs: list[float]) -> float:
+        """Capacity-weighted average over parallel entity-id / SOC columns."""
         capacities = self._settings.battery_capacities
 
         if not capacities:
             # Simple average
-            return sum(b["soc"] for b in batteries) / len(batteries)
+            return sum(socs) / len(socs)
 
         # Weighted average
         total_energy = 0.0
         total_capacity = 0.0
+        default_capacity = DEFAULT_POWER_ESTIMATES.default_battery_capacity
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
 
-        for battery in batteries:
-            entity_id = battery["entity_id"]
-            soc = battery["soc"]
-            capacity = capacities.get(
-                entity_id, DEFAULT_POWER_ESTIMATES.default_battery_capacity
-            )
+        for entity_id, soc in zip(entity_ids, socs):
+            capacity = capacities.get(entity_id, default_capacity)
 
             energy = (soc / 100.0) * capacity
             total_energy += energy
             total_capacity += capacity
 
-            _LOGGER.debug(
-                "Battery %s: SOC=%.1f%%, Capacity=%.1fkWh, Stored=%.2fkWh",
-                entity_id,
-                soc,
-                capacity,
-                energy,
-            )
+            if debug_enabled:
+                _LOGGER.debug(
+                    "Battery %s: SOC=%.1f%%, Capacity=%.1fkWh, Stored=%.2fkWh",
+                    entity_id,
+                    soc,
+                    capacity,
+                    energy,
+                )
 
         if total_capacity > 0:
             return (total_energy / total_capacity) * 100.0
 
-        return sum(b["soc"] for b in batteries) / len(batteries)
+        return sum(socs) / len(socs)
 
     def _create_no_battery_result(self) -> dict[str, Any]:
         """Create result when no batteries configured."""
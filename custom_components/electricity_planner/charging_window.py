@@ -21,12 +21,15 @@ from .const import (
     DEFAULT_PRICE_THRESHOLD,
     PRICE_INTERVAL_GAP_TOLERANCE_SECONDS,
 )
+from .helpers import same_objects
 
 if TYPE_CHECKING:
     from .coordinator import ElectricityPlannerCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+_GAP_TOLERANCE = timedelta(seconds=PRICE_INTERVAL_GAP_TOLERANCE_SECONDS)
+
 
 class ChargingWindowValidator:
     """Validate whether a minimum low-price charging window exists from now."""
@@ -84,12 +87,23 @@ class ChargingWindowValidator:
         if not timeline:
             return False
 
+        timeline_inputs = (
+            prices_today,
+            prices_tomorrow,
+            transport_lookup,
+            current_transport_cost,
+        )
+        if coordinator._last_price_timeline_data_hash is None or not same_objects(
+            coordinator._last_price_timeline_inputs, timeline_inputs
+        ):
+            coordinator._last_price_timeline_data_hash = (
+                coordinator._compute_price_data_hash(prices_today, prices_tomorrow)
+            )
         coordinator._last_price_timeline = timeline
         coordinator._last_price_timeline_generated_at = now
-        coordinator._last_price_timeline_data_hash = (
-            coordinator._compute_price_data_hash(prices_today, prices_tomorrow)
-        )
+        coordinator._last_price_timeline_inputs = timeline_inputs
 
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
         current_idx: int | None = None
         for idx, (start_time, interval_end, _) in enumerate(timeline):
             if interval_end <= now:
@@ -99,96 +113,102 @@ class ChargingWindowValidator:
                 break
 
         if current_idx is None:
-            _LOGGER.debug(
-                "No active Nord Pool interval covering current time %s", now.isoformat()
-            )
+            if debug_enabled:
+                _LOGGER.debug(
+                    "No active Nord Pool interval covering current time %s",
+                    now.isoformat(),
+                )
             return False
 
         min_duration_hours = coordinator.config.get(
             CONF_MIN_CAR_CHARGING_DURATION, DEFAULT_MIN_CAR_CHARGING_DURATION
         )
-        required_duration = timedelta(hours=min_duration_hours)
+        required_seconds = float(min_duration_hours) * 3600.0
 
         current_start, current_end, current_price = timeline[current_idx]
         if current_price > effective_threshold:
-            threshold_note = (
-                f"{'permissive ' if permissive_window_enabled else ''}threshold "
-                f"{effective_threshold:.4f} €/kWh (base {base_threshold:.4f} €/kWh)"
-            )
-            _LOGGER.debug(
-                "Current price %.4f €/kWh exceeds %s - no charging window starting now",
-                current_price,
-                threshold_note,
-            )
+            if debug_enabled:
+                threshold_note = (
+                    f"{'permissive ' if permissive_window_enabled else ''}threshold "
+                    f"{effective_threshold:.4f} €/kWh (base {base_threshold:.4f} €/kWh)"
+                )
+                _LOGGER.debug(
+                    "Current price %.4f €/kWh exceeds %s - no charging window starting now",
+                    current_price,
+                    threshold_note,
+                )
             return False
 
-        low_price_duration = current_end - max(now, current_start)
-        if low_price_duration >= required_duration:
-            threshold_note = (
-                f"≤ {effective_threshold:.4f} €/kWh "
-                f"(base {base_threshold:.4f} €/kWh)"
-                if permissive_window_enabled
-                else f"≤ {effective_threshold:.4f} €/kWh"
-            )
-            _LOGGER.debug(
-                "Found %d-hour charging window entirely within current interval (price %.4f €/kWh %s)",
-                min_duration_hours,
-                current_price,
-                threshold_note,
-            )
+        low_price_seconds = (current_end - max(now, current_start)).total_seconds()
+        if low_price_seconds >= required_seconds:
+            if debug_enabled:
+                threshold_note = (
+                    f"≤ {effective_threshold:.4f} €/kWh (base {base_threshold:.4f} €/kWh)"
+                    if permissive_window_enabled
+                    else f"≤ {effective_threshold:.4f} €/kWh"
+                )
+                _LOGGER.debug(
+                    "Found %d-hour charging window entirely within current interval (price %.4f €/kWh %s)",
+                    min_duration_hours,
+                    current_price,
+                    threshold_note,
+                )
             return True
 
+        gap_tolerance = _GAP_TOLERANCE
         previous_end = current_end
         for next_idx in range(current_idx + 1, len(timeline)):
             next_start, next_end, next_price = timeline[next_idx]
 
-            if next_start > previous_end + timedelta(
-                seconds=PRICE_INTERVAL_GAP_TOLERANCE_SECONDS
-            ):
-                _LOGGER.debug(
-                    "Charging window broken by gap between %s and %s",
-                    previous_end.isoformat(),
-                    next_start.isoformat(),
-                )
+            if next_start > previous_end + gap_tolerance:
+                if debug_enabled:
+                    _LOGGER.debug(
+                        "Charging window broken by gap between %s and %s",
+                        previous_end.isoformat(),
+                        next_start.isoformat(),
+                    )
                 break
 
             if next_price > effective_threshold:
-                threshold_note = (
-                    f"{'permissive ' if permissive_window_enabled else ''}threshold "
-                    f"{effective_threshold:.4f} €/kWh (base {base_threshold:.4f} €/kWh)"
-                )
-                _LOGGER.debug(
-                    "Charging window broken by high price %.4f €/kWh (> %s)",
-                    next_price,
-                    threshold_note,
-                )
+                if debug_enabled:
+                    threshold_note = (
+                        f"{'permissive ' if permissive_window_enabled else ''}threshold "
+                        f"{effective_threshold:.4f} €/kWh (base {base_threshold:.4f} €/kWh)"
+                    )
+                    _LOGGER.debug(
+                        "Charging window broken by high price %.4f €/kWh (> %s)",
+                        next_price,
+                        threshold_note,
+                    )
                 break
 
             effective_start = max(previous_end, next_start)
             if next_end <= effective_start:
                 continue
 
-            low_price_duration += next_end - effective_start
+            low_price_seconds += (next_end - effective_start).total_seconds()
             previous_end = max(previous_end, next_end)
 
-            if low_price_duration >= required_duration:
-                threshold_note = (
-                    f"≤ {effective_threshold:.4f} €/kWh "
-                    f"(base {base_threshold:.4f} €/kWh)"
-                    if permissive_window_enabled
-                    else f"≤ {effective_threshold:.4f} €/kWh"
-                )
-                _LOGGER.debug(
-                    "Found %d-hour charging window: %.1f hours of low prices (%s) ahead",
-                    min_duration_hours,
-                    low_price_duration.total_seconds() / 3600,
-                    threshold_note,
-                )
+            if low_price_seconds >= required_seconds:
+                if debug_enabled:
+                    threshold_note = (
+                        f"≤ {effective_threshold:.4f} €/kWh "
+                        f"(base {base_threshold:.4f} €/kWh)"
+                        if permissive_window_enabled
+                        else f"≤ {effective_threshold:.4f} €/kWh"
+                    )
+                    _LOGGER.debug(
+                        "Found %d-hour charging window: %.1f hours of low prices (%s) ahead",
+                        min_duration_hours,
+                        low_price_seconds / 3600,
+                        threshold_note,
+                    )
                 return True
 
-        _LOGGER.debug(
-            "Charging window too short: only %.1f hours of low prices from now (need %d)",
-            low_price_duration.total_seconds() / 3600,
-            min_duration_hours,
-        )
+        if debug_enabled:
+            _LOGGER.debug(
+                "Charging window too short: only %.1f hours of low prices from now (need %d)",
+                low_price_seconds / 3600,
+                min_duration_hours,
+            )
         return False
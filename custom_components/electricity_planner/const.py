@@ -191,7 +191,15 @@ DEFAULT_INVERTER_DERATING_SOC_BYPASS_THRESHOLD = (
 
 # Cache and Performance Constants
 NORDPOOL_CACHE_MAX_SIZE = 10  # Maximum number of cached Nord Pool price entries
-NORDPOOL_CACHE_TTL_MINUTES = 5  # Cache time-to-live in minutes
+NORDPOOL_CACHE_TTL_MINUTES = 5  # Minimum cache time-to-live in minutes
+NORDPOOL_CACHE_HOUR_GRACE_SECONDS = 30  # Keep cached prices until just past the hour
+TRANSPORT_COST_LOOKUP_TTL_MINUTES = 30  # Initial transport history refresh interval
+TRANSPORT_COST_LOOKUP_MIN_TTL_MINUTES = 5  # Floor while the history keeps changing
+TRANSPORT_COST_LOOKUP_MAX_TTL_MINUTES = 360  # Ceiling while the history is stable
+TRANSPORT_COST_SETTLE_SECONDS = 60  # Transport cost flips faster than this are noise
+INTERVAL_EXC_INFO_LOG_INTERVAL_SECONDS = (
+    60  # At most one traceback per minute from per-interval parse loops
+)
 
 # Time-based Constants (extracted from magic numbers)
 PRICE_INTERVAL_LOOKBACK_HOURS = 1  # How far back to look for price intervals
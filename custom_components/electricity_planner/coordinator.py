@@ -6,13 +6,18 @@ import asyncio
 import hashlib
 import json
 import logging
+import time
 from datetime import date, datetime, timedelta
-from typing import Any
+from typing import Any, NamedTuple
 
+from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import Event, HomeAssistant, callback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+)
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
@@ -80,15 +85,15 @@ from .const import (
     PHASE_MODE_THREE,
     PRICE_INTERVAL_MINUTES,
     PRICE_TIMELINE_MAX_AGE_HOURS,
+    TRANSPORT_COST_LOOKUP_TTL_MINUTES,
 )
 from .decision_engine import ChargingDecisionEngine
 from .entity_status import EntityStatusReporter
 from .forecast_summary import ForecastSummaryCalculator
 from .helpers import (
     PriceInterval,
-    extract_price_from_interval,
     is_in_month_peak_transition_window,
-    parse_datetime_cached,
+    nordpool_price_columns,
 )
 from .manual_overrides import ManualOverrideManager
 from .negative_buy import NegativeBuyPlanner
@@ -105,13 +110,63 @@ _CAR_PERMISSIVE_MODE_STORE_VERSION = 1
 _RUNTIME_MODE_STORE_VERSION = 1
 _BATTERY_CHARGING_STATE_STORE_VERSION = 1
 
+# Persistent notification texts, formatted only when a notification is sent
+_DATA_RESTORED_MESSAGE = (
+    "Nord Pool data has been restored after %.0f seconds. "
+    "Charging decisions are now active."
+)
+_DATA_UNAVAILABLE_MESSAGE = (
+    "Critical data (Nord Pool prices) has been unavailable for %.0f seconds. "
+    "All charging from grid is disabled for safety. "
+    "Please check your Nord Pool integration."
+)
+
+# Single-entity config keys whose entities trigger coordinator refreshes
+_TRACKED_PRICE_KEYS = (
+    CONF_CURRENT_PRICE_ENTITY,
+    CONF_HIGHEST_PRICE_ENTITY,
+    CONF_LOWEST_PRICE_ENTITY,
+    CONF_NEXT_PRICE_ENTITY,
+)
+_TRACKED_POWER_KEYS = (
+    CONF_SOLAR_PRODUCTION_ENTITY,
+    CONF_HOUSE_CONSUMPTION_ENTITY,
+    CONF_CAR_CHARGING_POWER_ENTITY,
+    CONF_MONTHLY_GRID_PEAK_ENTITY,
+    CONF_GRID_POWER_ENTITY,
+    CONF_P1_TARIFF_ENTITY,
+)
+_TRACKED_PHASE_KEYS = (
+    CONF_PHASE_SOLAR_ENTITY,
+    CONF_PHASE_CONSUMPTION_ENTITY,
+    CONF_PHASE_CAR_ENTITY,
+    CONF_PHASE_BATTERY_POWER_ENTITY,
+)
+
+_PEAK_MONITORING_DURATION = timedelta(minutes=PEAK_MONITORING_DURATION_MINUTES)
+_PEAK_LIMIT_DURATION = timedelta(minutes=PEAK_LIMIT_DURATION_MINUTES)
+
+
+class _EntityFetchPlan(NamedTuple):
+    """Entity IDs read on every update tick, resolved once per config."""
+
+    prices: tuple[tuple[str, str | None], ...]
+    battery_soc_entities: tuple[str, ...]
+    solar_entity: str | None
+    consumption_entity: str | None
+    car_entity: str | None
+    grid: tuple[tuple[str, str | None], ...]
+    transport_cost_entity: str | None
+    p1_tariff_entity: str | None
+    solar_forecast_entity: str | None
+    nordpool_config_entry: str | None
+
 
 class ElectricityPlannerCoordinator(DataUpdateCoordinator):
     """Coordinator for electricity planner data."""
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
-        self.hass = hass
         self.entry = entry
         merged_config: dict[str, Any] = dict(entry.data)
         if entry.options:
@@ -133,27 +188,40 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
 
         # Entity listener unsubscribe callback (set in _setup_entity_tracking)
         self._entity_unsub: callback | None = None
-        self._tracked_entity_ids: set[str] = set()
+        self._tracked_entity_ids: frozenset[str] = frozenset()
+
+        # Per-tick entity fetch plan, rebuilt whenever ``self.config`` is replaced
+        self._fetch_plan: _EntityFetchPlan | None = None
+        self._fetch_plan_config: dict[str, Any] | None = None
 
         # Permissive mode state (controlled via switch entity, persisted across updates)
         self._car_permissive_mode_active: bool = False
         self._car_permissive_mode_has_persisted_state: bool = False
 
         # Update throttling
-        self._last_entity_update = None
-        self._min_update_interval = timedelta(seconds=MIN_UPDATE_INTERVAL_SECONDS)
+        # Monotonic nanoseconds: immune to wall-clock steps and allocation-free
+        self._last_entity_update_ns: int | None = None
+        self._min_update_interval_ns = MIN_UPDATE_INTERVAL_SECONDS * 1_000_000_000
         self._update_lock = asyncio.Lock()  # Prevent race conditions in throttling
+        # Trailing refresh for events that land inside the throttle window
+        self._pending_refresh_unsub: callback | None = None
 
         # Nord Pool price caching (prices only update hourly)
         # Cache structure: {cache_key: (data, timestamp)}
         self._nordpool_cache: dict[str, tuple[dict[str, Any], datetime]] = {}
         self._nordpool_cache_max_size = NORDPOOL_CACHE_MAX_SIZE
+        # Days ("today"/"tomorrow") currently served from an expired cache entry
+        self._nordpool_stale_days: set[str] = set()
 
         # Transport cost lookup caching (expensive recorder query)
         self._transport_cost_lookup: list[dict[str, Any]] = []
         self._transport_cost_lookup_time: datetime | None = None
+        self._transport_cost_ttl = timedelta(minutes=TRANSPORT_COST_LOOKUP_TTL_MINUTES)
+        self._transport_cost_lookup_signature: int | None = None
         self._transport_cost_status: str = "not_configured"
         self._transport_cost_last_log: str | None = None
+        # Serialises rebuilds so overlapping refreshes share one recorder query
+        self._transport_cost_lock = asyncio.Lock()
 
         # Car charging state tracking for hysteresis
         self._previous_car_charging: bool = False
@@ -186,6 +254,9 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
         self._last_price_timeline_data_hash: str | None = (
             None  # Hash of price data used to build timeline
         )
+        # Input objects the cached timeline was built from, compared by identity
+        # so steady ticks can skip re-hashing the Nord Pool payload.
+        self._last_price_timeline_inputs: tuple[Any, ...] | None = None
         self._price_timeline_max_age = timedelta(hours=PRICE_TIMELINE_MAX_AGE_HOURS)
         self._active_timeline_cache_token: object | None = None
         self._purchase_timeline_cache: dict[tuple[Any, ...], list[PriceInterval]] = {}
@@ -425,21 +496,21 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
 
     def _is_data_available(self, data: dict[str, Any]) -> bool:
         """Check if critical price data is available for decisions."""
-        price_available = data.get("current_price") is not None
-        price_range_available = (
+        if data.get("current_price") is None:
+            return False
+        if (
             data.get("highest_price") is not None
             and data.get("lowest_price") is not None
-        )
+        ):
+            return True
         # Allow price analysis to mark availability once decision engine runs
-        price_analysis_available = data.get("price_analysis", {}).get("data_available")
-        return bool(
-            price_available and (price_range_available or price_analysis_available)
-        )
+        price_analysis = data.get("price_analysis")
+        return bool(price_analysis and price_analysis.get("data_available"))
 
     def _setup_entity_listeners(self):
         """Set up listeners for entity state changes."""
         entities_to_track = self._collect_tracked_entity_ids()
-        self._tracked_entity_ids = set(entities_to_track)
+        self._tracked_entity_ids = frozenset(entities_to_track)
         if entities_to_track:
             self._entity_unsub = async_track_state_change_event(
                 self.hass, entities_to_track, self._handle_entity_change
@@ -447,46 +518,25 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
 
     def _collect_tracked_entity_ids(self) -> list[str]:
         """Return all entities that should trigger coordinator refreshes."""
-        entities_to_track: list[str] = []
-
-        for entity_key in [
-            CONF_CURRENT_PRICE_ENTITY,
-            CONF_HIGHEST_PRICE_ENTITY,
-            CONF_LOWEST_PRICE_ENTITY,
-            CONF_NEXT_PRICE_ENTITY,
-        ]:
-            if self.config.get(entity_key):
-                entities_to_track.append(self.config[entity_key])
-
-        if self.config.get(CONF_BATTERY_SOC_ENTITIES):
-            entities_to_track.extend(self.config[CONF_BATTERY_SOC_ENTITIES])
-
-        for entity_key in [
-            CONF_SOLAR_PRODUCTION_ENTITY,
-            CONF_HOUSE_CONSUMPTION_ENTITY,
-            CONF_CAR_CHARGING_POWER_ENTITY,
-            CONF_MONTHLY_GRID_PEAK_ENTITY,
-            CONF_GRID_POWER_ENTITY,
-        ]:
-            if self.config.get(entity_key):
-                entities_to_track.append(self.config[entity_key])
-
-        if self.config.get(CONF_P1_TARIFF_ENTITY):
-            entities_to_track.append(self.config[CONF_P1_TARIFF_ENTITY])
+        config_get = self.config.get
+        entities_to_track = [
+            config_get(entity_key) for entity_key in _TRACKED_PRICE_KEYS
+        ]
+        entities_to_track.extend(config_get(CONF_BATTERY_SOC_ENTITIES) or ())
+        entities_to_track.extend(
+            config_get(entity_key) for entity_key in _TRACKED_POWER_KEYS
+        )
 
         if self.phase_mode == PHASE_MODE_THREE and self.phase_configs:
             for phase_config in self.phase_configs.values():
-                for entity_key in (
-                    CONF_PHASE_SOLAR_ENTITY,
-                    CONF_PHASE_CONSUMPTION_ENTITY,
-                    CONF_PHASE_CAR_ENTITY,
-                    CONF_PHASE_BATTERY_POWER_ENTITY,
-                ):
-                    phase_entity = phase_config.get(entity_key)
-                    if phase_entity:
-                        entities_to_track.append(phase_entity)
-
-        return [entity_id for entity_id in entities_to_track if entity_id]
+                entities_to_track.extend(
+                    phase_config.get(entity_key) for entity_key in _TRACKED_PHASE_KEYS
+                )
+
+        # One entity may fill several slots; subscribe to it once, keeping order.
+        return list(
+            dict.fromkeys(entity_id for entity_id in entities_to_track if entity_id)
+        )
 
     def _has_builtin_transport_cost(self) -> bool:
         """Delegate to the transport-cost resolver collaborator."""
@@ -539,32 +589,16 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
         )
 
         intervals: list[dict[str, Any]] = []
+        resolve_transport_cost = self._resolve_transport_cost
 
         def add_intervals(price_map: dict[str, Any] | None, source: str) -> None:
-            if not isinstance(price_map, dict):
-                return
-
-            area_code = next(iter(price_map.keys()), None)
-            if not area_code or not isinstance(price_map[area_code], list):
-                return
-
-            for interval in price_map[area_code]:
-                start_raw = interval.get("start")
-                if not start_raw:
-                    continue
-
-                start = parse_datetime_cached(start_raw)
-                if start is None:
-                    continue
-                start_utc = dt_util.as_utc(start)
-
-                raw_value = extract_price_from_interval(interval)
-                if raw_value is None:
-                    continue
-
+            columns = nordpool_price_columns(price_map)
+            for start_utc, end_utc, raw_value in zip(
+                columns.starts, columns.ends, columns.prices
+            ):
                 raw_price = raw_value / 1000
                 adjusted_energy_price = (raw_price * multiplier) + offset
-                transport_cost = self._resolve_transport_cost(
+                transport_cost = resolve_transport_cost(
                     transport_lookup, start_utc, reference_now=now
                 )
                 if transport_cost is None:
@@ -578,15 +612,6 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
                     adjusted_energy_price + transport_cost
                 ) * buy_vat_multiplier
 
-                end_utc: datetime | None = None
-                end_raw = interval.get("end")
-                if end_raw:
-                    parsed_end = parse_datetime_cached(end_raw)
-                    if parsed_end is not None:
-                        candidate_end = dt_util.as_utc(parsed_end)
-                        if candidate_end > start_utc:
-                            end_utc = candidate_end
-
                 intervals.append(
                     {
                         "source": source,
@@ -742,12 +767,8 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
                 else:
                     # Check if sustained for configured duration
                     exceed_duration = now - self._car_peak_limit_started_at
-                    if exceed_duration >= timedelta(
-                        minutes=PEAK_MONITORING_DURATION_MINUTES
-                    ):
-                        self._car_peak_limited_until = now + timedelta(
-                            minutes=PEAK_LIMIT_DURATION_MINUTES
-                        )
+                    if exceed_duration >= _PEAK_MONITORING_DURATION:
+                        self._car_peak_limited_until = now + _PEAK_LIMIT_DURATION
                         self._car_peak_limit_started_at = None  # Reset monitoring
                         _LOGGER.info(
                             "Grid import %.0fW exceeded %.0fW for %d minutes. "
@@ -975,12 +996,16 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
             event: Home Assistant state change event
         """
         # Note: This is a callback, so we can't use async lock directly
-        # The throttling is handled by checking _last_entity_update timestamp
+        # The throttling is handled by checking _last_entity_update_ns
         entity_id = event.data.get("entity_id")
         _LOGGER.debug("Entity changed: %s", entity_id)
-        tracked_entity_ids = self._tracked_entity_ids or set(
-            self._collect_tracked_entity_ids()
-        )
+        tracked_entity_ids = self._tracked_entity_ids
+        if not tracked_entity_ids:
+            # Listeners were never set up (e.g. setup deferred); collect once
+            # instead of rebuilding the list on every event.
+            tracked_entity_ids = self._tracked_entity_ids = frozenset(
+                self._collect_tracked_entity_ids()
+            )
         if entity_id in tracked_entity_ids:
             # Use async task to avoid blocking the callback
             # Note: Throttling is handled atomically in _async_handle_throttled_update
@@ -991,22 +1016,30 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
         """Handle entity update with atomic throttling check."""
         should_refresh = False
         async with self._update_lock:
-            now = dt_util.utcnow()
+            now_ns = time.monotonic_ns()
 
             # Apply minimum interval throttling (atomic check-and-set)
             if (
-                self._last_entity_update is None
-                or now - self._last_entity_update >= self._min_update_interval
+                self._last_entity_update_ns is None
+                or now_ns - self._last_entity_update_ns >= self._min_update_interval_ns
             ):
-
-                self._last_entity_update = now
+                self._last_entity_update_ns = now_ns
                 should_refresh = True
-            else:
+                if self._pending_refresh_unsub is not None:
+                    # This refresh supersedes the trailing one
+                    self._pending_refresh_unsub()
+                    self._pending_refresh_unsub = None
+            elif self._pending_refresh_unsub is None:
+                # Don't drop the burst's latest change: refresh once the
+                # window closes instead.
                 time_remaining = (
-                    self._last_entity_update + self._min_update_interval - now
-                ).total_seconds()
+                    self._last_entity_update_ns + self._min_update_interval_ns - now_ns
+                ) / 1_000_000_000
+                self._pending_refresh_unsub = async_call_later(
+                    self.hass, time_remaining, self._handle_trailing_refresh
+                )
                 _LOGGER.debug(
-                    "Entity update skipped for %s (throttled, %.1fs remaining)",
+                    "Entity update deferred for %s (throttled, %.1fs remaining)",
                     entity_id,
                     time_remaining,
                 )
@@ -1016,9 +1049,16 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
             _LOGGER.debug(
                 "Entity update triggered for %s (throttled to %ds minimum)",
                 entity_id,
-                self._min_update_interval.total_seconds(),
+                MIN_UPDATE_INTERVAL_SECONDS,
             )
 
+    @callback
+    def _handle_trailing_refresh(self, _now: datetime) -> None:
+        """Refresh for entity changes that arrived inside the throttle window."""
+        self._pending_refresh_unsub = None
+        self._last_entity_update_ns = time.monotonic_ns()
+        self.hass.async_create_task(self.async_request_refresh())
+
     def _get_current_price_interval_start(self) -> datetime:
         """Get the start time of the active price interval."""
         now = dt_util.utcnow()
@@ -1202,7 +1242,7 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
                 await self._async_persist_battery_charging_state()
 
             # Check data availability and handle notifications
-            await self._check_data_availability(data)
+            self._check_data_availability(data)
 
             return data
 
@@ -1215,38 +1255,60 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
             self._purchase_timeline_cache.clear()
             self._feedin_timeline_cache.clear()
 
+    def _entity_fetch_plan(self) -> _EntityFetchPlan:
+        """Return the per-tick fetch plan, rebuilding it when config is replaced."""
+        config = self.config
+        if self._fetch_plan is None or self._fetch_plan_config is not config:
+            self._fetch_plan = _EntityFetchPlan(
+                prices=(
+                    ("current_price", config.get(CONF_CURRENT_PRICE_ENTITY)),
+                    ("highest_price", config.get(CONF_HIGHEST_PRICE_ENTITY)),
+                    ("lowest_price", config.get(CONF_LOWEST_PRICE_ENTITY)),
+                    ("next_price", config.get(CONF_NEXT_PRICE_ENTITY)),
+                ),
+                battery_soc_entities=tuple(config.get(CONF_BATTERY_SOC_ENTITIES, ())),
+                solar_entity=config.get(CONF_SOLAR_PRODUCTION_ENTITY),
+                consumption_entity=config.get(CONF_HOUSE_CONSUMPTION_ENTITY),
+                car_entity=config.get(CONF_CAR_CHARGING_POWER_ENTITY),
+                grid=(
+                    ("monthly_grid_peak", config.get(CONF_MONTHLY_GRID_PEAK_ENTITY)),
+                    ("grid_power", config.get(CONF_GRID_POWER_ENTITY)),
+                ),
+                transport_cost_entity=config.get(CONF_TRANSPORT_COST_ENTITY),
+                p1_tariff_entity=config.get(CONF_P1_TARIFF_ENTITY),
+                solar_forecast_entity=config.get(CONF_SOLAR_FORECAST_ENTITY_TOMORROW),
+                nordpool_config_entry=config.get(CONF_NORDPOOL_CONFIG_ENTRY),
+            )
+            self._fetch_plan_config = config
+        return self._fetch_plan
+
     async def _fetch_all_data(self) -> dict[str, Any]:
         """Fetch data from all configured entities."""
         data = {}
+        plan = self._entity_fetch_plan()
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
 
         # Price data
-        data["current_price"] = await self._get_state_value(
-            self.config.get(CONF_CURRENT_PRICE_ENTITY)
-        )
-        data["highest_price"] = await self._get_state_value(
-            self.config.get(CONF_HIGHEST_PRICE_ENTITY)
-        )
-        data["lowest_price"] = await self._get_state_value(
-            self.config.get(CONF_LOWEST_PRICE_ENTITY)
-        )
-        data["next_price"] = await self._get_state_value(
-            self.config.get(CONF_NEXT_PRICE_ENTITY)
-        )
+        for key, entity_id in plan.prices:
+            data[key] = self._get_state_value(entity_id)
+
         # Battery SOC data
-        battery_soc_entities = self.config.get(CONF_BATTERY_SOC_ENTITIES, [])
+        battery_soc_entities = plan.battery_soc_entities
         battery_soc_values = []
 
-        _LOGGER.debug("Battery SOC entities configured: %s", battery_soc_entities)
+        if debug_enabled:
+            _LOGGER.debug("Battery SOC entities configured: %s", battery_soc_entities)
 
         for entity_id in battery_soc_entities:
-            soc = await self._get_state_value(entity_id)
-            state = self.hass.states.get(entity_id)
-            _LOGGER.debug(
-                "Battery entity %s: state=%s, parsed_value=%s",
-                entity_id,
-                state.state if state else "missing",
-                soc,
-            )
+            soc = self._get_state_value(entity_id)
+            if debug_enabled:
+                state = self.hass.states.get(entity_id)
+                _LOGGER.debug(
+                    "Battery entity %s: state=%s, parsed_value=%s",
+                    entity_id,
+                    state.state if state else "missing",
+                    soc,
+                )
             if soc is not None:
                 # Validate and normalize battery SOC
                 if 0 <= soc <= BATTERY_SOC_DECIMAL_THRESHOLD:
@@ -1275,7 +1337,8 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
                 )
 
         data["battery_soc"] = battery_soc_values
-        _LOGGER.debug("Final battery SOC data: %s", battery_soc_values)
+        if debug_enabled:
+            _LOGGER.debug("Final battery SOC data: %s", battery_soc_values)
 
         # Map batteries to phases (always available for diagnostics)
         battery_capacities_cfg = self.config.get(CONF_BATTERY_CAPACITIES, {})
@@ -1350,7 +1413,7 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
 
                 # Solar: Read actual per-phase production from sensor
                 solar_entity = phase_config.get(CONF_PHASE_SOLAR_ENTITY)
-                solar_val = await self._get_state_value(solar_entity)
+                solar_val = self._get_state_value(solar_entity)
 
                 if solar_val is not None and solar_val > 0:
                     solar_present = True
@@ -1358,25 +1421,25 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
 
                 # Consumption: from per-phase sensor (required)
                 consumption_entity = phase_config.get(CONF_PHASE_CONSUMPTION_ENTITY)
-                consumption_val = await self._get_state_value(consumption_entity)
+                consumption_val = self._get_state_value(consumption_entity)
                 if consumption_val is not None:
                     consumption_present = True
                     total_consumption_value += consumption_val
 
                 # Car: from per-phase sensor (optional)
                 car_entity = phase_config.get(CONF_PHASE_CAR_ENTITY)
-                car_val = await self._get_state_value(car_entity)
+                car_val = self._get_state_value(car_entity)
                 if car_val is not None:
                     car_present = True
                     total_car_value += car_val
 
                 # Grid power: from per-phase sensor (optional, positive = import)
                 grid_power_entity = phase_config.get(CONF_PHASE_GRID_POWER_ENTITY)
-                grid_power_val = await self._get_state_value(grid_power_entity)
+                grid_power_val = self._get_state_value(grid_power_entity)
 
                 # Battery power: from per-phase sensor (optional, negative = charging)
                 battery_power_entity = phase_config.get(CONF_PHASE_BATTERY_POWER_ENTITY)
-                battery_power_val = await self._get_state_value(battery_power_entity)
+                battery_power_val = self._get_state_value(battery_power_entity)
 
                 # Calculate phase surplus - consistent with single-phase mode
                 # Allow solar_val to be 0 (not just > 0)
@@ -1399,7 +1462,8 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
 
             if phase_details:
                 data["phase_details"] = phase_details
-                _LOGGER.debug("Per-phase power snapshot: %s", phase_details)
+                if debug_enabled:
+                    _LOGGER.debug("Per-phase power snapshot: %s", phase_details)
 
             data["solar_production"] = total_solar_value if solar_present else None
             data["house_consumption"] = (
@@ -1409,27 +1473,22 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
             if car_present:
                 data["car_charging_power"] = total_car_value
             else:
-                data["car_charging_power"] = await self._get_state_value(
-                    self.config.get(CONF_CAR_CHARGING_POWER_ENTITY)
-                )
+                data["car_charging_power"] = self._get_state_value(plan.car_entity)
 
             solar_total = data["solar_production"] or 0
             consumption_total = data["house_consumption"] or 0
             data["solar_surplus"] = max(0, solar_total - consumption_total)
-            _LOGGER.debug(
-                "Aggregated power totals: solar=%sW, consumption=%sW, surplus=%sW",
-                data["solar_production"],
-                data["house_consumption"],
-                data["solar_surplus"],
-            )
+            if debug_enabled:
+                _LOGGER.debug(
+                    "Aggregated power totals: solar=%sW, consumption=%sW, surplus=%sW",
+                    data["solar_production"],
+                    data["house_consumption"],
+                    data["solar_surplus"],
+                )
         else:
             # Single-phase mode
-            solar_production = await self._get_state_value(
-                self.config.get(CONF_SOLAR_PRODUCTION_ENTITY)
-            )
-            house_consumption = await self._get_state_value(
-                self.config.get(CONF_HOUSE_CONSUMPTION_ENTITY)
-            )
+            solar_production = self._get_state_value(plan.solar_entity)
+            house_consumption = self._get_state_value(plan.consumption_entity)
 
             data["solar_production"] = solar_production
             data["house_consumption"] = house_consumption
@@ -1441,24 +1500,18 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
             else:
                 data["solar_surplus"] = 0
 
-            _LOGGER.debug(
-                "Solar production: %sW, house consumption: %sW, available surplus: %sW",
-                solar_production,
-                house_consumption,
-                data["solar_surplus"],
-            )
-
-            data["car_charging_power"] = await self._get_state_value(
-                self.config.get(CONF_CAR_CHARGING_POWER_ENTITY)
-            )
+            if debug_enabled:
+                _LOGGER.debug(
+                    "Solar production: %sW, house consumption: %sW, available surplus: %sW",
+                    solar_production,
+                    house_consumption,
+                    data["solar_surplus"],
+                )
 
-        data["monthly_grid_peak"] = await self._get_state_value(
-            self.config.get(CONF_MONTHLY_GRID_PEAK_ENTITY)
-        )
+            data["car_charging_power"] = self._get_state_value(plan.car_entity)
 
-        data["grid_power"] = await self._get_state_value(
-            self.config.get(CONF_GRID_POWER_ENTITY)
-        )
+        for key, entity_id in plan.grid:
+            data[key] = self._get_state_value(entity_id)
         data["previous_grid_power"] = self.data.get("grid_power") if self.data else None
 
         # Preserve prior inverter target so the derating controller can hold or
@@ -1477,7 +1530,7 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
         # until the next day's start hour, so midnight entity flips don't affect
         # overnight charging.  Before the start hour on the first day (no cache
         # yet), use the live value.
-        solar_forecast_entity = self.config.get(CONF_SOLAR_FORECAST_ENTITY_TOMORROW)
+        solar_forecast_entity = plan.solar_forecast_entity
         if solar_forecast_entity:
             data["solar_forecast_production"] = await self._resolve_solar_forecast(
                 solar_forecast_entity
@@ -1504,7 +1557,7 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
             data["transport_cost_lookup"] = []
             data["transport_cost_status"] = "builtin"
             # Store current P1 tariff code for diagnostics
-            p1_entity = self.config.get(CONF_P1_TARIFF_ENTITY)
+            p1_entity = plan.p1_tariff_entity
             if p1_entity:
                 state = self.hass.states.get(p1_entity)
                 data["p1_tariff_code"] = (
@@ -1515,32 +1568,37 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
             else:
                 data["p1_tariff_code"] = None
         else:
-            data["transport_cost"] = await self._get_state_value(
-                self.config.get(CONF_TRANSPORT_COST_ENTITY)
-            )
+            data["transport_cost"] = self._get_state_value(plan.transport_cost_entity)
 
         # Fetch full day price data if Nord Pool config entry is configured
         # This retrieves all price intervals for today and tomorrow at whatever
         # granularity Nord Pool provides (currently 15-min, but flexible)
-        nordpool_config_entry = self.config.get(CONF_NORDPOOL_CONFIG_ENTRY)
+        nordpool_config_entry = plan.nordpool_config_entry
+
+        async def _transport_lookup() -> tuple[list[dict[str, Any]], str]:
+            if self._has_builtin_transport_cost():
+                return [], "builtin"
+            return await self._get_transport_cost_lookup(data.get("transport_cost"))
+
         if nordpool_config_entry:
-            data["nordpool_prices_today"] = await self._fetch_nordpool_prices(
-                nordpool_config_entry, "today"
-            )
-            data["nordpool_prices_tomorrow"] = await self._fetch_nordpool_prices(
-                nordpool_config_entry, "tomorrow"
+            # The two price days are independent service calls (each with its
+            # own retry backoff) and the transport lookup may wait on the
+            # recorder executor, so all three run concurrently.
+            (
+                data["nordpool_prices_today"],
+                data["nordpool_prices_tomorrow"],
+                (transport_lookup, transport_status),
+            ) = await asyncio.gather(
+                self._fetch_nordpool_prices(nordpool_config_entry, "today"),
+                self._fetch_nordpool_prices(nordpool_config_entry, "tomorrow"),
+                _transport_lookup(),
             )
         else:
             data["nordpool_prices_today"] = None
             data["nordpool_prices_tomorrow"] = None
+            transport_lookup, transport_status = await _transport_lookup()
+        data["nordpool_prices_stale"] = sorted(self._nordpool_stale_days)
 
-        if self._has_builtin_transport_cost():
-            transport_lookup: list[dict[str, Any]] = []
-            transport_status = "builtin"
-        else:
-            transport_lookup, transport_status = await self._get_transport_cost_lookup(
-                data.get("transport_cost")
-            )
         data["transport_cost_lookup"] = transport_lookup
         data["transport_cost_status"] = transport_status
         data["price_analysis_overrides"] = self._build_price_analysis_overrides(
@@ -1587,9 +1645,9 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
 
         return data
 
-    async def _get_state_value(self, entity_id: str | None) -> float | None:
+    def _get_state_value(self, entity_id: str | None) -> float | None:
         """Delegate to the entity status reporter collaborator."""
-        return await self._entity_status_reporter.get_state_value(entity_id)
+        return self._entity_status_reporter.get_state_value(entity_id)
 
     def get_all_entity_statuses(self) -> dict[str, Any]:
         """Delegate to the entity status reporter collaborator."""
@@ -1674,7 +1732,8 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
         """Delegate to the transport-cost resolver collaborator."""
         return await self._transport_cost_resolver.get_lookup(current_transport_cost)
 
-    async def _check_data_availability(self, data: dict[str, Any]) -> None:
+    @callback
+    def _check_data_availability(self, data: dict[str, Any]) -> None:
         """Check data availability and send notifications if needed."""
         now = dt_util.utcnow()
 
@@ -1684,18 +1743,22 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
         if data_is_available:
             # Data is available - reset tracking
             self._last_successful_update = now
+            if self._data_unavailable_since is None and not self._notification_sent:
+                # Steady healthy state: nothing to recover or reset.
+                return
             if self._data_unavailable_since is not None and self._notification_sent:
                 # Data was unavailable but is now available - send recovery notification
-                unavailable_duration = now - self._data_unavailable_since
-                await self._send_notification(
+                unavailable_seconds = (
+                    now - self._data_unavailable_since
+                ).total_seconds()
+                self._send_notification(
                     "Electricity Planner Data Restored",
-                    f"Nord Pool data has been restored after {unavailable_duration.total_seconds():.0f} seconds. "
-                    f"Charging decisions are now active.",
+                    _DATA_RESTORED_MESSAGE % unavailable_seconds,
                     "electricity_planner_data_restored",
                 )
                 _LOGGER.info(
                     "Data availability restored after %.1f seconds",
-                    unavailable_duration.total_seconds(),
+                    unavailable_seconds,
                 )
             if self._data_unavailable_since is not None:
                 self._data_unavailable_since = None
@@ -1708,38 +1771,32 @@ class ElectricityPlannerCoordinator(DataUpdateCoordinator):
                 _LOGGER.warning("Critical data unavailable - starting tracking")
             else:
                 # Data has been unavailable for some time
-                unavailable_duration = now - self._data_unavailable_since
+                unavailable_seconds = (
+                    now - self._data_unavailable_since
+                ).total_seconds()
 
                 # Send notification if data unavailable for more than 1 minute and notification not sent yet
-                if (
-                    unavailable_duration > timedelta(minutes=1)
-                    and not self._notification_sent
-                ):
-                    await self._send_notification(
+                if unavailable_seconds > 60 and not self._notification_sent:
+                    self._send_notification(
                         "Electricity Planner Data Unavailable",
-                        f"Critical data (Nord Pool prices) has been unavailable for {unavailable_duration.total_seconds():.0f} seconds. "
-                        f"All charging from grid is disabled for safety. Please check your Nord Pool integration.",
+                        _DATA_UNAVAILABLE_MESSAGE % unavailable_seconds,
                         "electricity_planner_data_unavailable",
                     )
                     self._notification_sent = True
                     _LOGGER.error(
                         "Data unavailable notification sent after %.1f seconds",
-                        unavailable_duration.total_seconds(),
+                        unavailable_seconds,
                     )
 
-    async def _send_notification(
+    @callback
+    def _send_notification(
         self, title: str, message: str, notification_id: str
     ) -> None:
         """Send a persistent notification."""
         try:
-            await self.hass.services.async_call(
-                "persistent_notification",
-                "create",
-                {
-                    "title": title,
-                    "message": message,
-                    "notification_id": notification_id,
-                },
+            # Use the callback API directly instead of a service-call round trip.
+            persistent_notification.async_create(
+                self.hass, message, title=title, notification_id=notification_id
             )
             _LOGGER.info("Sent notification: %s", title)
         except Exception as err:
@@ -26,6 +26,7 @@ _EXPORT_KEYS = [
     "has_min_charging_window",
     "average_threshold",
     "transport_cost_status",
+    "nordpool_prices_stale",
 ]
 
 
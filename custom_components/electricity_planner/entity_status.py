@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
@@ -45,23 +46,48 @@ _LOGGER = logging.getLogger(__name__)
 
 _NUMERIC_PREFIX_RE = re.compile(r"^\s*([-+]?\d+(?:[.,]\d+)?)")
 
+_UNAVAILABLE_STATES = frozenset((STATE_UNAVAILABLE, STATE_UNKNOWN))
+
 
 class EntityStatusReporter:
     """Reads numeric entity states and produces diagnostic status reports."""
 
     def __init__(self, coordinator: ElectricityPlannerCoordinator) -> None:
         self._coordinator = coordinator
+        # Bound on first read: state reads run many times per update tick.
+        self._states_get: Callable[[str], Any] | None = None
+        # entity_id -> (state.last_updated_timestamp, parsed value)
+        self._state_value_cache: dict[str, tuple[float, float | None]] = {}
 
-    async def get_state_value(self, entity_id: str | None) -> float | None:
+    def get_state_value(self, entity_id: str | None) -> float | None:
         """Get numeric state value from entity."""
         if not entity_id:
             return None
 
-        state = self._coordinator.hass.states.get(entity_id)
-        if not state or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        states_get = self._states_get
+        if states_get is None:
+            states_get = self._states_get = self._coordinator.hass.states.get
+        state = states_get(entity_id)
+        if not state or state.state in _UNAVAILABLE_STATES:
             return None
 
-        raw_value = str(state.state).strip()
+        # State objects are replaced (with a new last_updated) on every change,
+        # so a matching timestamp means the cached parse is still valid.
+        last_updated = getattr(state, "last_updated_timestamp", None)
+        if last_updated is not None:
+            cached = self._state_value_cache.get(entity_id)
+            if cached is not None and cached[0] == last_updated:
+                return cached[1]
+
+        value = self._parse_state_value(entity_id, state.state)
+        if last_updated is not None:
+            self._state_value_cache[entity_id] = (last_updated, value)
+        return value
+
+    @staticmethod
+    def _parse_state_value(entity_id: str, state_value: Any) -> float | None:
+        """Parse a raw entity state into a float, tolerating common variants."""
+        raw_value = str(state_value).strip()
         try:
             return float(raw_value)
         except (ValueError, TypeError):
@@ -76,7 +102,7 @@ class EntityStatusReporter:
 
             if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug(
-                    "Could not convert state to float: %s = %s", entity_id, state.state
+                    "Could not convert state to float: %s = %s", entity_id, state_value
                 )
             return None
 
@@ -8,6 +8,7 @@ underlying price-data hash changes or when the cache exceeds its max age.
 from __future__ import annotations
 
 import logging
+from bisect import bisect_right
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
@@ -17,6 +18,7 @@ from .const import (
     CONF_MIN_CAR_CHARGING_DURATION,
     DEFAULT_MIN_CAR_CHARGING_DURATION,
 )
+from .helpers import PriceInterval, isoformat_local, same_objects
 
 if TYPE_CHECKING:
     from .coordinator import ElectricityPlannerCoordinator
@@ -29,6 +31,10 @@ class ForecastSummaryCalculator:
 
     def __init__(self, coordinator: ElectricityPlannerCoordinator) -> None:
         self._coordinator = coordinator
+        # Interval end times of the last timeline seen, for bisecting on ``now``.
+        # ``None`` when that timeline's ends are not monotone.
+        self._ends_timeline: list[tuple[datetime, datetime, float]] | None = None
+        self._ends: list[datetime] | None = None
 
     def calculate(
         self,
@@ -55,14 +61,29 @@ class ForecastSummaryCalculator:
                 (now - coordinator._last_price_timeline_generated_at).total_seconds()
                 / 3600,
             )
-            coordinator._last_price_timeline = None
-            coordinator._last_price_timeline_generated_at = None
-            coordinator._last_price_timeline_data_hash = None
-
-        # Compute hash of current price data to detect changes
-        current_price_hash = coordinator._compute_price_data_hash(
-            prices_today, prices_tomorrow
+            self._invalidate_timeline()
+
+        # When the cached timeline was built from these exact input objects
+        # (the charging-window check earlier in the same update), it is
+        # current by construction and the payload does not need re-hashing.
+        timeline_inputs = (
+            prices_today,
+            prices_tomorrow,
+            transport_lookup,
+            current_transport_cost,
         )
+        current_price_hash: str | None
+        if (
+            coordinator._last_price_timeline is not None
+            and coordinator._last_price_timeline_data_hash is not None
+            and same_objects(coordinator._last_price_timeline_inputs, timeline_inputs)
+        ):
+            current_price_hash = coordinator._last_price_timeline_data_hash
+        else:
+            # Compute hash of current price data to detect changes
+            current_price_hash = coordinator._compute_price_data_hash(
+                prices_today, prices_tomorrow
+            )
 
         # Invalidate cache if price data has changed — but only when we
         # actually *have* new price data.  When both are None the caller has
@@ -75,18 +96,14 @@ class ForecastSummaryCalculator:
             _LOGGER.debug(
                 "Price data changed (hash mismatch), invalidating timeline cache"
             )
-            coordinator._last_price_timeline = None
-            coordinator._last_price_timeline_generated_at = None
-            coordinator._last_price_timeline_data_hash = None
+            self._invalidate_timeline()
 
         if not prices_today and not prices_tomorrow:
             if coordinator._last_price_timeline:
                 timeline = coordinator._last_price_timeline
                 stale = True
             else:
-                coordinator._last_price_timeline = None
-                coordinator._last_price_timeline_generated_at = None
-                coordinator._last_price_timeline_data_hash = None
+                self._invalidate_timeline()
                 return {"available": False}
         else:
             timeline = (
@@ -103,21 +120,16 @@ class ForecastSummaryCalculator:
                 coordinator._last_price_timeline = timeline
                 coordinator._last_price_timeline_generated_at = now
                 coordinator._last_price_timeline_data_hash = current_price_hash
+                coordinator._last_price_timeline_inputs = timeline_inputs
 
         if not timeline:
-            coordinator._last_price_timeline = None
-            coordinator._last_price_timeline_generated_at = None
-            coordinator._last_price_timeline_data_hash = None
+            self._invalidate_timeline()
             return {"available": False}
 
         # Consider only intervals that are in the future
-        future_segments = [
-            (start, end, price) for start, end, price in timeline if end > now
-        ]
+        future_segments = self._future_segments(timeline, now)
         if not future_segments:
-            coordinator._last_price_timeline = None
-            coordinator._last_price_timeline_generated_at = None
-            coordinator._last_price_timeline_data_hash = None
+            self._invalidate_timeline()
             return {"available": False}
 
         cheapest_segment = min(future_segments, key=lambda segment: segment[2])
@@ -129,24 +141,19 @@ class ForecastSummaryCalculator:
 
         best_window = self._find_best_window(future_segments, now, required_duration)
 
-        def _iso_local(dt_obj: datetime) -> str:
-            """Return ISO string in Home Assistant's local timezone."""
-            localized = dt_util.as_local(dt_obj)
-            return localized.isoformat()
-
         summary: dict[str, Any] = {
             "available": True,
-            "cheapest_interval_start": _iso_local(cheapest_segment[0]),
-            "cheapest_interval_end": _iso_local(cheapest_segment[1]),
-            "cheapest_interval_price": round(cheapest_segment[2], 4),
+            "cheapest_interval_start": isoformat_local(cheapest_segment[0]),
+            "cheapest_interval_end": isoformat_local(cheapest_segment[1]),
+            "cheapest_interval_price": cheapest_segment[2],
             "average_threshold": minimum_average_threshold,
-            "evaluated_at": _iso_local(now),
+            "evaluated_at": isoformat_local(now),
         }
 
         if stale:
             summary["stale"] = True
         if coordinator._last_price_timeline_generated_at:
-            summary["timeline_generated_at"] = _iso_local(
+            summary["timeline_generated_at"] = isoformat_local(
                 coordinator._last_price_timeline_generated_at
             )
 
@@ -154,58 +161,117 @@ class ForecastSummaryCalculator:
             summary.update(
                 {
                     "best_window_hours": min_duration_hours,
-                    "best_window_start": _iso_local(best_window["start"]),
-                    "best_window_end": _iso_local(best_window["end"]),
-                    "best_window_average_price": round(best_window["average_price"], 4),
+                    "best_window_start": isoformat_local(best_window.start),
+                    "best_window_end": isoformat_local(best_window.end),
+                    "best_window_average_price": best_window.price,
                 }
             )
 
         return summary
 
+    def _future_segments(
+        self,
+        timeline: list[tuple[datetime, datetime, float]],
+        now: datetime,
+    ) -> list[tuple[datetime, datetime, float]]:
+        """Return the suffix of *timeline* whose intervals end after *now*.
+
+        The timeline is sorted and non-overlapping, so its end times are
+        monotone and the future part can be located with a binary search. The
+        ends list is built once per timeline object and reused while the
+        coordinator keeps serving the cached timeline.
+        """
+        if timeline is not self._ends_timeline:
+            ends = [segment[1] for segment in timeline]
+            monotone = all(ends[idx - 1] <= ends[idx] for idx in range(1, len(ends)))
+            self._ends_timeline = timeline
+            self._ends = ends if monotone else None
+
+        if self._ends is None:
+            return [segment for segment in timeline if segment[1] > now]
+        return timeline[bisect_right(self._ends, now) :]
+
+    def _invalidate_timeline(self) -> None:
+        """Drop the coordinator's cached price timeline and its metadata."""
+        coordinator = self._coordinator
+        coordinator._last_price_timeline = None
+        coordinator._last_price_timeline_generated_at = None
+        coordinator._last_price_timeline_data_hash = None
+        coordinator._last_price_timeline_inputs = None
+
     @staticmethod
     def _find_best_window(
         future_segments: list[tuple[datetime, datetime, float]],
         now: datetime,
         required_duration: timedelta,
-    ) -> dict[str, Any] | None:
-        """Scan future segments for the cheapest contiguous window of required duration."""
-        best_window: dict[str, Any] | None = None
-        for idx in range(len(future_segments)):
-            window_start = max(future_segments[idx][0], now)
-            window_end_target = window_start + required_duration
-            window_duration = timedelta(0)
+    ) -> PriceInterval | None:
+        """Scan future segments for the cheapest contiguous window of required duration.
+
+        The O(N·W) scan runs on epoch-second floats rather than ``datetime`` /
+        ``timedelta`` objects so the inner loop is plain float arithmetic;
+        datetimes are only rebuilt for the winning window, returned as a
+        ``PriceInterval`` whose price is the window's average.
+        """
+        required_seconds = required_duration.total_seconds()
+        if required_seconds <= 0:
+            return None
+
+        now_ts = now.timestamp()
+        starts = [segment[0].timestamp() for segment in future_segments]
+        ends = [segment[1].timestamp() for segment in future_segments]
+        prices = [segment[2] for segment in future_segments]
+        count = len(future_segments)
+
+        best_idx = -1
+        best_end_idx = -1
+        best_average = 0.0
+        for idx in range(count):
+            window_start = starts[idx] if starts[idx] > now_ts else now_ts
+            window_end_target = window_start + required_seconds
+            window_seconds = 0.0
             price_sum = 0.0
             current_time = window_start
+            end_idx = -1
 
-            for segment_idx in range(idx, len(future_segments)):
-                segment_start, segment_end, segment_price = future_segments[segment_idx]
+            for segment_idx in range(idx, count):
+                segment_end = ends[segment_idx]
                 if segment_end <= current_time:
                     continue
 
-                effective_start = max(segment_start, current_time)
-                effective_end = min(segment_end, window_end_target)
-
+                segment_start = starts[segment_idx]
+                effective_start = (
+                    segment_start if segment_start > current_time else current_time
+                )
+                effective_end = (
+                    segment_end
+                    if segment_end < window_end_target
+                    else window_end_target
+                )
                 if effective_end <= effective_start:
                     continue
 
                 duration = effective_end - effective_start
-                hours = duration.total_seconds() / 3600
-                price_sum += segment_price * hours
-                window_duration += duration
+                price_sum += prices[segment_idx] * (duration / 3600)
+                window_seconds += duration
                 current_time = effective_end
+                end_idx = segment_idx
 
                 if current_time >= window_end_target:
                     break
 
-            if window_duration >= required_duration and window_duration > timedelta(0):
-                hours_total = window_duration.total_seconds() / 3600
-                if hours_total <= 0:
-                    continue
-                average_price = price_sum / hours_total
-                if best_window is None or average_price < best_window["average_price"]:
-                    best_window = {
-                        "start": window_start,
-                        "end": current_time,
-                        "average_price": average_price,
-                    }
-        return best_window
+            if window_seconds >= required_seconds:
+                average_price = price_sum / (window_seconds / 3600)
+                if best_idx < 0 or average_price < best_average:
+                    best_idx = idx
+                    best_end_idx = end_idx
+                    best_average = average_price
+
+        if best_idx < 0:
+            return None
+
+        window_start_dt = max(future_segments[best_idx][0], now)
+        return PriceInterval(
+            window_start_dt,
+            min(future_segments[best_end_idx][1], window_start_dt + required_duration),
+            best_average,
+        )
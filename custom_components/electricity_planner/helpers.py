@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import logging
 import re
+import time
+from bisect import bisect_right
 from datetime import date, datetime, timedelta
 from datetime import timezone as dt_timezone
 from functools import lru_cache
@@ -28,6 +30,7 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 _INTEGER_RE = re.compile(r"^[+-]?\d+$")
+_PRICE_KEYS = ("value", "value_exc_vat", "price")
 
 
 @lru_cache(maxsize=1024)
@@ -56,6 +59,168 @@ def parse_datetime_cached(value: Any) -> datetime | None:
     return _parse_datetime_cached(value)
 
 
+@lru_cache(maxsize=1024)
+def _parse_datetime_utc_cached(value: str, time_zone: Any) -> datetime | None:
+    """LRU-backed parse + UTC normalisation keyed on the string and local zone."""
+    parsed = _parse_datetime_cached(value)
+    if parsed is None:
+        return None
+    return dt_util.as_utc(parsed)
+
+
+def parse_datetime_utc_cached(value: Any) -> datetime | None:
+    """Parse an ISO-8601 string and normalise it to UTC, caching the result.
+
+    Nord Pool ``start`` / ``end`` strings are always parsed and immediately
+    converted with ``dt_util.as_utc``; caching the pair saves the timezone
+    conversion as well. Naive strings are interpreted in Home Assistant's
+    default zone, so that zone is part of the cache key and a timezone
+    change never serves stale conversions.
+    """
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        parsed = dt_util.parse_datetime(value)
+        return dt_util.as_utc(parsed) if parsed is not None else None
+    return _parse_datetime_utc_cached(value, dt_util.DEFAULT_TIME_ZONE)
+
+
+@lru_cache(maxsize=256)
+def _isoformat_local_cached(value: datetime, time_zone: Any) -> str:
+    """LRU-backed delegate for local ISO formatting keyed on instant and zone."""
+    return dt_util.as_local(value).isoformat()
+
+
+def isoformat_local(value: datetime) -> str:
+    """Return *value* as an ISO-8601 string in Home Assistant's local zone.
+
+    Forecast and planning summaries format the same handful of interval
+    boundaries on every update; memoising the timezone conversion and
+    formatting avoids redoing it each cycle. The active zone is part of the
+    cache key so a timezone change is picked up immediately.
+    """
+    return _isoformat_local_cached(value, dt_util.DEFAULT_TIME_ZONE)
+
+
+def primary_area_intervals(prices: Any) -> list[dict[str, Any]]:
+    """Return the interval list of the first area in a Nord Pool response.
+
+    Nord Pool payloads are keyed by area code and the integration only ever
+    consumes the first area. Centralising the lookup keeps the
+    ``next(iter(...))`` / ``isinstance`` dance in one place; an empty list is
+    returned when the payload is missing or malformed.
+    """
+    if not isinstance(prices, dict):
+        return []
+    for intervals in prices.values():
+        return intervals if isinstance(intervals, list) else []
+    return []
+
+
+class NordpoolPriceColumns(NamedTuple):
+    """Structure-of-arrays view of one Nord Pool area's interval list.
+
+    ``starts`` holds ascending UTC start datetimes with the matching end (or
+    ``None`` when missing or not after the start) in ``ends`` and the raw
+    €/MWh price in ``prices``. Intervals without a parseable start or price
+    are dropped once here, so consumers can iterate without validation.
+    """
+
+    starts: list[datetime]
+    ends: list[datetime | None]
+    prices: list[float]
+
+
+def _interval_end_utc(
+    interval: dict[str, Any], start_time_utc: datetime
+) -> datetime | None:
+    """Return the interval's UTC end when it parses and follows the start."""
+    end_time_str = interval.get("end")
+    if not end_time_str:
+        return None
+    try:
+        end_time_utc = parse_datetime_utc_cached(end_time_str)
+    except (ValueError, TypeError):
+        return None
+    if end_time_utc is None or end_time_utc <= start_time_utc:
+        return None
+    return end_time_utc
+
+
+def build_nordpool_price_columns(
+    intervals: list[dict[str, Any]],
+) -> NordpoolPriceColumns:
+    """Parse a Nord Pool interval list once into parallel sorted columns."""
+    rows: list[tuple[datetime, datetime | None, float]] = []
+    for interval in intervals:
+        try:
+            start_time_str = interval.get("start")
+            if not start_time_str:
+                continue
+            start_time_utc = parse_datetime_utc_cached(start_time_str)
+            if start_time_utc is None:
+                continue
+            price_value = extract_price_from_interval(interval)
+            if price_value is None:
+                continue
+            end_time_utc = _interval_end_utc(interval, start_time_utc)
+        except (ValueError, TypeError, KeyError, AttributeError):
+            continue
+        rows.append((start_time_utc, end_time_utc, price_value))
+
+    if len(rows) != len(intervals):
+        _LOGGER.debug(
+            "Dropped %d malformed Nord Pool interval(s) of %d",
+            len(intervals) - len(rows),
+            len(intervals),
+        )
+
+    if any(rows[idx - 1][0] > rows[idx][0] for idx in range(1, len(rows))):
+        rows.sort(key=lambda row: row[0])
+
+    return NordpoolPriceColumns(
+        [row[0] for row in rows], [row[1] for row in rows], [row[2] for row in rows]
+    )
+
+
+# Columns for recently seen interval lists, keyed by identity. The Nord Pool
+# service hands back the same cached response objects until its TTL expires,
+# so today's and tomorrow's lists are parsed once per fetch rather than once
+# per update tick. The list itself is held to keep its id from being reused,
+# and the local zone is recorded because naive starts are parsed against it.
+_NORDPOOL_COLUMNS_CACHE_SIZE = 4
+_nordpool_columns_cache: dict[
+    int, tuple[list[dict[str, Any]], Any, NordpoolPriceColumns]
+] = {}
+
+
+def nordpool_price_columns(prices: Any) -> NordpoolPriceColumns:
+    """Return (cached) columns for the primary area of a Nord Pool payload."""
+    intervals = primary_area_intervals(prices)
+    if not intervals:
+        return NordpoolPriceColumns([], [], [])
+    time_zone = dt_util.DEFAULT_TIME_ZONE
+    cached = _nordpool_columns_cache.get(id(intervals))
+    if cached is not None and cached[0] is intervals and cached[1] is time_zone:
+        return cached[2]
+    columns = build_nordpool_price_columns(intervals)
+    if len(_nordpool_columns_cache) >= _NORDPOOL_COLUMNS_CACHE_SIZE:
+        _nordpool_columns_cache.clear()
+    _nordpool_columns_cache[id(intervals)] = (intervals, time_zone, columns)
+    return columns
+
+
+def same_objects(previous: tuple[Any, ...] | None, current: tuple[Any, ...]) -> bool:
+    """Return True when both tuples hold the very same objects (by identity).
+
+    Used to detect that a cached derivation was computed from the exact input
+    objects seen now, which is far cheaper than hashing their contents.
+    """
+    if previous is None or len(previous) != len(current):
+        return False
+    return all(old is new for old, new in zip(previous, current))
+
+
 def extract_price_from_interval(interval: dict[str, Any]) -> float | None:
     """Extract price value from a Nord Pool interval dict.
 
@@ -68,7 +233,11 @@ def extract_price_from_interval(interval: dict[str, Any]) -> float | None:
     Returns:
         The price as a float, or None if no valid price key is found.
     """
-    for key in ("value", "value_exc_vat", "price"):
+    # Fast path: current Nord Pool payloads carry a float under "value".
+    value = interval.get("value")
+    if type(value) is float:
+        return value
+    for key in _PRICE_KEYS:
         value = interval.get(key)
         if isinstance(value, (int, float)):
             return float(value)
@@ -80,6 +249,31 @@ def extract_price_from_interval(interval: dict[str, Any]) -> float | None:
     return None
 
 
+class ExcInfoThrottle:
+    """Rate-limit traceback capture for warnings raised inside hot loops.
+
+    Formatting ``exc_info`` walks and renders the whole traceback; when an
+    upstream data glitch hits every interval of a price payload that cost is
+    paid hundreds of times per update. ``allow()`` returns True at most once
+    per ``interval_seconds`` (monotonic clock), so the first occurrence keeps
+    its traceback and repeats log just the message.
+    """
+
+    __slots__ = ("_interval_ns", "_last_ns")
+
+    def __init__(self, interval_seconds: float) -> None:
+        self._interval_ns = int(interval_seconds * 1_000_000_000)
+        self._last_ns: int | None = None
+
+    def allow(self) -> bool:
+        """Return True when a traceback may be attached to the next record."""
+        now_ns = time.monotonic_ns()
+        if self._last_ns is not None and now_ns - self._last_ns < self._interval_ns:
+            return False
+        self._last_ns = now_ns
+        return True
+
+
 class PriceInterval(NamedTuple):
     """A single price interval with start time, end time, and price.
 
@@ -249,26 +443,87 @@ def _same_local_time_last_week(target_time_utc: datetime) -> datetime:
     return _coerce_local_datetime(week_ago_naive)
 
 
-def _entry_local_datetime(entry: dict[str, Any]) -> datetime | None:
-    """Return the cached local datetime for a transport-lookup entry.
+def _entry_timestamp(entry: dict[str, Any]) -> float | None:
+    """Return the epoch-seconds start of a transport-lookup entry.
 
-    Production lookups built by ``TransportCostResolver.get_lookup`` already
-    embed a parsed ``_local`` field, which avoids a ~134 k ``parse_datetime``
-    calls per update cycle (192 intervals \u00d7 ~672 history entries). Tests and
-    legacy callers pass raw ``{"start": iso_str, "cost": x}`` dicts \u2014 fall
-    back to parsing on demand for those.
+    Lookups built by ``TransportCostResolver.get_lookup`` store ``start`` as a
+    UTC epoch float so resolution is plain float comparison. Tests and legacy
+    callers may still pass ISO strings; those are parsed (cached) on demand.
     """
-    cached = entry.get("_local")
-    if isinstance(cached, datetime):
-        return cached
-
-    entry_start_str = entry.get("start")
-    if entry_start_str is None:
-        return None
-    parsed = parse_datetime_cached(entry_start_str)
+    start = entry.get("start")
+    if isinstance(start, (int, float)):
+        return float(start)
+    parsed = parse_datetime_utc_cached(start)
     if parsed is None:
         return None
-    return dt_util.as_local(dt_util.as_utc(parsed))
+    return parsed.timestamp()
+
+
+class TransportCostColumns(NamedTuple):
+    """Structure-of-arrays view of a transport-cost lookup.
+
+    ``starts`` holds ascending UTC epoch seconds with the matching cost at the
+    same index in ``costs``; ``fallback`` is the cost of an undated
+    (current-value) entry, used when no dated change precedes a timestamp.
+    """
+
+    starts: list[float]
+    costs: list[float]
+    fallback: float | None
+
+    def cost_at(self, timestamp: float) -> float | None:
+        """Return the cost in effect at ``timestamp`` (epoch seconds)."""
+        idx = bisect_right(self.starts, timestamp) - 1
+        if idx >= 0:
+            return self.costs[idx]
+        return self.fallback
+
+
+def build_transport_cost_columns(
+    transport_lookup: list[dict[str, Any]],
+) -> TransportCostColumns:
+    """Split a list-of-dicts transport lookup into parallel sorted columns."""
+    pairs: list[tuple[float, float]] = []
+    fallback: float | None = None
+    for entry in transport_lookup:
+        entry_cost = entry.get("cost")
+        if entry_cost is None:
+            continue
+        if entry.get("start") is None:
+            fallback = float(entry_cost)
+            continue
+        entry_ts = _entry_timestamp(entry)
+        if entry_ts is None:
+            continue
+        pairs.append((entry_ts, float(entry_cost)))
+
+    if any(pairs[idx - 1][0] > pairs[idx][0] for idx in range(1, len(pairs))):
+        pairs.sort(key=lambda pair: pair[0])
+
+    return TransportCostColumns(
+        [start for start, _ in pairs], [cost for _, cost in pairs], fallback
+    )
+
+
+# Columns for the most recently resolved lookup, keyed by identity. The
+# coordinator replaces (never mutates) its lookup list on refresh, so one slot
+# covers every per-interval call made against the current lookup.
+_transport_columns_cache: tuple[list[dict[str, Any]], TransportCostColumns] | None = (
+    None
+)
+
+
+def transport_cost_columns(
+    transport_lookup: list[dict[str, Any]],
+) -> TransportCostColumns:
+    """Return (cached) columns for ``transport_lookup``."""
+    global _transport_columns_cache
+    cached = _transport_columns_cache
+    if cached is not None and cached[0] is transport_lookup:
+        return cached[1]
+    columns = build_transport_cost_columns(transport_lookup)
+    _transport_columns_cache = (transport_lookup, columns)
+    return columns
 
 
 def resolve_transport_cost_from_lookup(
@@ -283,46 +538,16 @@ def resolve_transport_cost_from_lookup(
     if reference_now is None:
         reference_now = dt_util.utcnow()
 
-    target_local = dt_util.as_local(start_time_utc)
+    columns = transport_cost_columns(transport_lookup)
 
     if start_time_utc > reference_now:
-        week_ago_local = _same_local_time_last_week(start_time_utc)
-        cost_from_pattern: float | None = None
-        for entry in transport_lookup:
-            entry_cost = entry.get("cost")
-            if entry_cost is None:
-                continue
-            if entry.get("start") is None:
-                cost_from_pattern = float(entry_cost)
-                continue
-            entry_local = _entry_local_datetime(entry)
-            if entry_local is None:
-                continue
-            if entry_local <= week_ago_local:
-                cost_from_pattern = float(entry_cost)
-            else:
-                break
-
+        cost_from_pattern = columns.cost_at(
+            _same_local_time_last_week(start_time_utc).timestamp()
+        )
         if cost_from_pattern is not None:
             return cost_from_pattern
 
-    cost: float | None = None
-    for entry in transport_lookup:
-        entry_cost = entry.get("cost")
-        if entry_cost is None:
-            continue
-        if entry.get("start") is None:
-            cost = float(entry_cost)
-            continue
-        entry_local = _entry_local_datetime(entry)
-        if entry_local is None:
-            continue
-        if entry_local <= target_local:
-            cost = float(entry_cost)
-        else:
-            break
-
-    return cost
+    return columns.cost_at(start_time_utc.timestamp())
 
 
 def is_day_tariff(timestamp_utc: datetime, p1_tariff_code: str | None = None) -> bool:
@@ -26,7 +26,7 @@ from .const import (
     DEFAULT_MAX_GRID_POWER,
     DEFAULT_NEGATIVE_BUY_THRESHOLD,
 )
-from .helpers import coerce_integral_range, resolve_local_deadline
+from .helpers import coerce_integral_range, isoformat_local, resolve_local_deadline
 
 if TYPE_CHECKING:
     from .coordinator import ElectricityPlannerCoordinator
@@ -137,9 +137,6 @@ class NegativeBuyPlanner:
         """Select eligible buy slots and decorate the plan with status/reason."""
         coordinator = self._coordinator
 
-        def _iso_local(dt_obj: datetime) -> str:
-            return dt_util.as_local(dt_obj).isoformat()
-
         now = dt_util.utcnow()
         timeline = coordinator._build_price_timeline(
             data.get("nordpool_prices_today"),
@@ -155,7 +152,7 @@ class NegativeBuyPlanner:
             return plan
 
         deadline = self.deadline(now)
-        plan["deadline"] = _iso_local(deadline)
+        plan["deadline"] = isoformat_local(deadline)
         eligible_slots: list[dict[str, Any]] = []
         selected_duration = timedelta(0)
         current_slot_price: float | None = None
@@ -192,8 +189,8 @@ class NegativeBuyPlanner:
 
         plan["selected_slots"] = [
             {
-                "start": _iso_local(slot["start"]),
-                "end": _iso_local(slot["end"]),
+                "start": isoformat_local(slot["start"]),
+                "end": isoformat_local(slot["end"]),
                 "price": round(slot["price"], 4),
             }
             for slot in eligible_slots
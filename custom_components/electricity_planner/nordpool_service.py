@@ -10,12 +10,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.util import dt as dt_util
 
-from .const import NORDPOOL_CACHE_MAX_SIZE, NORDPOOL_CACHE_TTL_MINUTES
+from .const import (
+    NORDPOOL_CACHE_HOUR_GRACE_SECONDS,
+    NORDPOOL_CACHE_MAX_SIZE,
+    NORDPOOL_CACHE_TTL_MINUTES,
+)
 
 if TYPE_CHECKING:
     from .coordinator import ElectricityPlannerCoordinator
@@ -23,6 +27,19 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+def _cache_valid_until(cached_time: datetime) -> datetime:
+    """Return when a Nord Pool response cached at ``cached_time`` expires.
+
+    Published prices only change on hour boundaries, so an entry stays valid
+    until just past the next full hour, and never for less than the minimum
+    TTL.
+    """
+    next_hour = cached_time.replace(minute=0, second=0, microsecond=0) + timedelta(
+        hours=1, seconds=NORDPOOL_CACHE_HOUR_GRACE_SECONDS
+    )
+    return max(next_hour, cached_time + timedelta(minutes=NORDPOOL_CACHE_TTL_MINUTES))
+
+
 class NordpoolService:
     """Fetches and caches Nord Pool price responses for today/tomorrow."""
 
@@ -33,13 +50,15 @@ class NordpoolService:
         """Remove expired entries from Nord Pool cache based on TTL and size limit."""
         coordinator = self._coordinator
         now = dt_util.utcnow()
-        ttl = timedelta(minutes=NORDPOOL_CACHE_TTL_MINUTES)
+        today = dt_util.now().date().isoformat()
 
-        # First, remove expired entries
+        # First, remove expired entries for past dates. Expired entries for
+        # today/tomorrow are kept as a fallback for failed refetches; keys end
+        # in the ISO target date, which orders lexicographically.
         expired_keys = [
             key
             for key, (_, timestamp) in coordinator._nordpool_cache.items()
-            if now - timestamp > ttl
+            if now >= _cache_valid_until(timestamp) and key.rpartition("_")[2] < today
         ]
         for key in expired_keys:
             del coordinator._nordpool_cache[key]
@@ -58,6 +77,26 @@ class NordpoolService:
                 del coordinator._nordpool_cache[key]
                 _LOGGER.debug("Evicted old Nord Pool cache entry (size limit): %s", key)
 
+    def _stale_cached_prices(self, cache_key: str, day: str) -> dict[str, Any] | None:
+        """Return the last good response for ``cache_key`` after a failed refetch.
+
+        Prices for a given date do not change once published, so an expired
+        entry is still correct and beats dropping every price-based decision
+        over a transient service failure. The day is flagged in
+        ``_nordpool_stale_days`` until a fresh response or cache hit clears it.
+        """
+        cached = self._coordinator._nordpool_cache.get(cache_key)
+        if cached is None:
+            return None
+        cached_data, cached_time = cached
+        self._coordinator._nordpool_stale_days.add(day)
+        _LOGGER.warning(
+            "Using stale Nord Pool prices for %s (age: %.1f minutes)",
+            day,
+            (dt_util.utcnow() - cached_time).total_seconds() / 60,
+        )
+        return cached_data
+
     async def fetch_prices(
         self, config_entry_id: str, day: str
     ) -> dict[str, Any] | None:
@@ -65,7 +104,8 @@ class NordpoolService:
         coordinator = self._coordinator
         try:
             # Calculate the target date
-            now_local = dt_util.now()
+            now = dt_util.utcnow()
+            now_local = dt_util.as_local(now)
             if day == "today":
                 target_date = now_local.date()
             elif day == "tomorrow":
@@ -76,13 +116,14 @@ class NordpoolService:
                 )
                 return None
 
+            coordinator._nordpool_stale_days.discard(day)
+
             # Check cache after resolving the concrete date to avoid midnight rollover bleed.
-            now = dt_util.utcnow()
             cache_key = f"{config_entry_id}_{target_date.isoformat()}"
             if cache_key in coordinator._nordpool_cache:
                 cached_data, cached_time = coordinator._nordpool_cache[cache_key]
-                cache_age = now - cached_time
-                if cache_age < timedelta(minutes=NORDPOOL_CACHE_TTL_MINUTES):
+                if now < _cache_valid_until(cached_time):
+                    cache_age = now - cached_time
                     _LOGGER.debug(
                         "Using cached Nord Pool prices for %s (%s) (age: %.1f minutes)",
                         day,
@@ -135,7 +176,7 @@ class NordpoolService:
                             max_retries,
                             err,
                         )
-                        return None
+                        return self._stale_cached_prices(cache_key, day)
                 except Exception as err:
                     if isinstance(err, (KeyboardInterrupt, SystemExit)):
                         raise
@@ -157,21 +198,22 @@ class NordpoolService:
                             max_retries,
                             err,
                         )
-                        return None
+                        return self._stale_cached_prices(cache_key, day)
 
             # The service returns a dict with area-based price data
             if response and isinstance(response, dict):
-                # Count total entries across all areas for logging
-                total_entries = sum(
-                    len(v) for v in response.values() if isinstance(v, list)
-                )
-                _LOGGER.debug(
-                    "Fetched Nord Pool prices for %s (%s): %d entries across %d area(s)",
-                    day,
-                    target_date.isoformat(),
-                    total_entries,
-                    len(response),
-                )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    # Count total entries across all areas for logging
+                    total_entries = sum(
+                        len(v) for v in response.values() if isinstance(v, list)
+                    )
+                    _LOGGER.debug(
+                        "Fetched Nord Pool prices for %s (%s): %d entries across %d area(s)",
+                        day,
+                        target_date.isoformat(),
+                        total_entries,
+                        len(response),
+                    )
 
                 # Evict oldest cache entry if cache is full
                 if (
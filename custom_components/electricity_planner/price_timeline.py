@@ -13,8 +13,6 @@ from collections.abc import Callable
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.util import dt as dt_util
-
 from .const import (
     CONF_BUY_VAT_MULTIPLIER,
     CONF_FEEDIN_ADJUSTMENT_MULTIPLIER,
@@ -26,16 +24,18 @@ from .const import (
     DEFAULT_FEEDIN_ADJUSTMENT_OFFSET,
     DEFAULT_PRICE_ADJUSTMENT_MULTIPLIER,
     DEFAULT_PRICE_ADJUSTMENT_OFFSET,
+    INTERVAL_EXC_INFO_LOG_INTERVAL_SECONDS,
     PRICE_INTERVAL_LOOKBACK_HOURS,
     PRICE_INTERVAL_MINUTES,
     PRICE_VALUE_MAX_EUR_MWH,
     PRICE_VALUE_MIN_EUR_MWH,
 )
 from .helpers import (
+    ExcInfoThrottle,
+    NordpoolPriceColumns,
     PriceInterval,
     apply_price_adjustment,
-    extract_price_from_interval,
-    parse_datetime_cached,
+    nordpool_price_columns,
 )
 
 if TYPE_CHECKING:
@@ -49,81 +49,52 @@ class PriceTimelineBuilder:
 
     def __init__(self, coordinator: "ElectricityPlannerCoordinator") -> None:
         self._coordinator = coordinator
+        self._exc_info_throttle = ExcInfoThrottle(
+            INTERVAL_EXC_INFO_LOG_INTERVAL_SECONDS
+        )
 
     def parse_intervals(
         self,
         prices_today: dict[str, Any] | None,
         prices_tomorrow: dict[str, Any] | None,
         now: datetime,
-        price_fn: Callable[[dict[str, Any], float, datetime], float | None],
+        price_fn: Callable[[float, datetime], float | None],
     ) -> list[PriceInterval]:
         """Build a chronological price timeline using a pluggable price function.
 
-        The *price_fn* callback receives ``(interval, raw_price_kwh, start_utc)``
-        and must return the final €/kWh price to record, or ``None`` to skip the
-        interval.
+        The *price_fn* callback receives ``(raw_price_kwh, start_utc)`` and must
+        return the final €/kWh price to record, or ``None`` to skip the
+        interval. Payloads are read through the per-fetch column cache, which
+        has already dropped malformed intervals.
         """
         future_intervals: list[tuple[datetime, datetime | None, float]] = []
-
-        def process_intervals(intervals: list[dict[str, Any]]) -> None:
-            for interval in intervals:
-                try:
-                    start_time_str = interval.get("start")
-                    if not start_time_str:
-                        continue
-
-                    start_time = parse_datetime_cached(start_time_str)
-                    if start_time is None:
-                        continue
-                    start_time_utc = dt_util.as_utc(start_time)
-
-                    end_time: datetime | None = None
-                    end_time_str = interval.get("end")
-                    if end_time_str:
-                        try:
-                            parsed_end = parse_datetime_cached(end_time_str)
-                            if parsed_end is not None:
-                                end_time_utc = dt_util.as_utc(parsed_end)
-                                if end_time_utc > start_time_utc:
-                                    end_time = end_time_utc
-                        except Exception as exc:
-                            if isinstance(exc, (KeyboardInterrupt, SystemExit)):
-                                raise
-                            end_time = None
-
-                    if end_time is not None:
-                        if end_time <= now:
-                            continue
-                    else:
-                        if start_time_utc < now - timedelta(
-                            hours=PRICE_INTERVAL_LOOKBACK_HOURS
-                        ):
-                            continue
-
-                    price_value = extract_price_from_interval(interval)
-                    if price_value is None:
-                        continue
-
-                    if (
-                        not PRICE_VALUE_MIN_EUR_MWH
-                        <= price_value
-                        <= PRICE_VALUE_MAX_EUR_MWH
-                    ):
-                        _LOGGER.warning(
-                            "Suspicious price value %.2f €/MWh outside expected range [%d, %d], skipping interval",
-                            price_value,
-                            PRICE_VALUE_MIN_EUR_MWH,
-                            PRICE_VALUE_MAX_EUR_MWH,
-                        )
-                        continue
-
-                    raw_price_kwh = price_value / 1000
-                    final_price = price_fn(interval, raw_price_kwh, start_time_utc)
-                    if final_price is None:
+        lookback_cutoff = now - timedelta(hours=PRICE_INTERVAL_LOOKBACK_HOURS)
+
+        def process_columns(columns: NordpoolPriceColumns) -> None:
+            for start_time_utc, end_time, price_value in zip(
+                columns.starts, columns.ends, columns.prices
+            ):
+                if end_time is not None:
+                    if end_time <= now:
                         continue
+                elif start_time_utc < lookback_cutoff:
+                    continue
 
-                    future_intervals.append((start_time_utc, end_time, final_price))
+                if (
+                    not PRICE_VALUE_MIN_EUR_MWH
+                    <= price_value
+                    <= PRICE_VALUE_MAX_EUR_MWH
+                ):
+                    _LOGGER.warning(
+                        "Suspicious price value %.2f €/MWh outside expected range [%d, %d], skipping interval",
+                        price_value,
+                        PRICE_VALUE_MIN_EUR_MWH,
+                        PRICE_VALUE_MAX_EUR_MWH,
+                    )
+                    continue
 
+                try:
+                    final_price = price_fn(price_value / 1000, start_time_utc)
                 except (ValueError, TypeError, KeyError, AttributeError) as err:
                     _LOGGER.debug(
                         "Expected error processing interval for price timeline: %s", err
@@ -135,21 +106,24 @@ class PriceTimelineBuilder:
                     _LOGGER.warning(
                         "Unexpected error processing interval for price timeline: %s",
                         err,
-                        exc_info=True,
+                        exc_info=_LOGGER.isEnabledFor(logging.WARNING)
+                        and self._exc_info_throttle.allow(),
                     )
                     continue
+                if final_price is None:
+                    continue
 
-        if prices_today:
-            area_code = next(iter(prices_today.keys()), None)
-            if area_code and isinstance(prices_today[area_code], list):
-                process_intervals(prices_today[area_code])
+                future_intervals.append((start_time_utc, end_time, final_price))
 
-        if prices_tomorrow:
-            area_code = next(iter(prices_tomorrow.keys()), None)
-            if area_code and isinstance(prices_tomorrow[area_code], list):
-                process_intervals(prices_tomorrow[area_code])
+        process_columns(nordpool_price_columns(prices_today))
+        process_columns(nordpool_price_columns(prices_tomorrow))
 
-        future_intervals.sort(key=lambda item: item[0])
+        # Each day's columns are already sorted; only sort when the days overlap.
+        if any(
+            future_intervals[idx - 1][0] > future_intervals[idx][0]
+            for idx in range(1, len(future_intervals))
+        ):
+            future_intervals.sort(key=lambda item: item[0])
 
         if not future_intervals:
             return []
@@ -209,11 +183,7 @@ class PriceTimelineBuilder:
                 CONF_BUY_VAT_MULTIPLIER, DEFAULT_BUY_VAT_MULTIPLIER
             )
 
-        def _purchase_price(
-            interval: dict[str, Any],
-            raw_price_kwh: float,
-            start_utc: datetime,
-        ) -> float | None:
+        def _purchase_price(raw_price_kwh: float, start_utc: datetime) -> float | None:
             adjusted_price = (raw_price_kwh * multiplier) + offset
             transport_cost = coordinator._resolve_transport_cost(
                 transport_lookup, start_utc, reference_now=now
@@ -250,11 +220,7 @@ class PriceTimelineBuilder:
             DEFAULT_FEEDIN_ADJUSTMENT_OFFSET,
         )
 
-        def _feedin_price(
-            interval: dict[str, Any],
-            raw_price_kwh: float,
-            start_utc: datetime,
-        ) -> float | None:
+        def _feedin_price(raw_price_kwh: float, start_utc: datetime) -> float | None:
             final_price = apply_price_adjustment(raw_price_kwh, multiplier, offset)
             return final_price if final_price is not None else raw_price_kwh
 
@@ -78,6 +78,8 @@ from .helpers import (
     extract_price_from_interval,
     is_in_month_peak_transition_window,
     parse_datetime_cached,
+    parse_datetime_utc_cached,
+    primary_area_intervals,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -88,6 +90,22 @@ _LOGGER = logging.getLogger(__name__)
 # the dashboard chart 6h of history plus the forward-looking forecast.
 _MAX_RECORDER_INTERVALS = 150
 
+_FORECAST_PRICE_KEYS = ("cheapest_interval_price", "best_window_average_price")
+
+
+def _display_forecast_summary(summary: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of the forecast summary with prices rounded for display.
+
+    The coordinator keeps full precision; publishing 4 decimals keeps state
+    attributes readable and avoids recorder churn on float noise.
+    """
+    attributes = summary.copy()
+    for key in _FORECAST_PRICE_KEYS:
+        price = attributes.get(key)
+        if price is not None:
+            attributes[key] = round(price, 4)
+    return attributes
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -964,7 +982,9 @@ class DecisionDiagnosticsSensor(ElectricityPlannerSensorBase):
             },
             # Strategy evaluation order
             "strategy_trace": self.coordinator.data.get("strategy_trace", []),
-            "forecast_summary": self.coordinator.data.get("forecast_summary", {}),
+            "forecast_summary": _display_forecast_summary(
+                self.coordinator.data.get("forecast_summary") or {}
+            ),
             # Power outputs
             "power_outputs": {
                 "charger_limit": self.coordinator.data.get("charger_limit", 0),
@@ -1197,7 +1217,8 @@ class ForecastInsightsSensor(ElectricityPlannerSensorBase):
         summary = self.coordinator.data.get("forecast_summary")
         if not summary or not summary.get("available"):
             return None
-        return summary.get("cheapest_interval_price")
+        price = summary.get("cheapest_interval_price")
+        return round(price, 4) if price is not None else None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -1207,7 +1228,7 @@ class ForecastInsightsSensor(ElectricityPlannerSensorBase):
         summary = self.coordinator.data.get("forecast_summary")
         if not summary:
             return {}
-        return summary.copy()
+        return _display_forecast_summary(summary)
 
 
 class PriceThresholdSensor(ElectricityPlannerSensorBase):
@@ -1717,30 +1738,13 @@ class NordPoolPricesSensor(ElectricityPlannerSensorBase):
         # Combine today and tomorrow prices into a single list for easier dashboard usage
         combined_prices: list[dict[str, Any]] = []
 
-        if prices_today:
-            # Get first area (or you could make this configurable)
-            area_code = next(iter(prices_today.keys()), None)
-            if area_code:
-                for interval in prices_today[area_code]:
-                    normalized = self._normalize_price_interval(
-                        interval, transport_lookup
-                    )
-                    if normalized:
-                        compact = self._compact_price_interval(normalized)
-                        if compact:
-                            combined_prices.append(compact)
-
-        if prices_tomorrow:
-            area_code = next(iter(prices_tomorrow.keys()), None)
-            if area_code:
-                for interval in prices_tomorrow[area_code]:
-                    normalized = self._normalize_price_interval(
-                        interval, transport_lookup
-                    )
-                    if normalized:
-                        compact = self._compact_price_interval(normalized)
-                        if compact:
-                            combined_prices.append(compact)
+        for prices in (prices_today, prices_tomorrow):
+            for interval in primary_area_intervals(prices):
+                normalized = self._normalize_price_interval(interval, transport_lookup)
+                if normalized:
+                    compact = self._compact_price_interval(normalized)
+                    if compact:
+                        combined_prices.append(compact)
 
         # Calculate some useful statistics
         price_values = [price_entry["price"] for price_entry in combined_prices]
@@ -1889,11 +1893,8 @@ class NordPoolPricesSensor(ElectricityPlannerSensorBase):
 
         transport_cost = 0.0
         start_time_str = interval.get("start")
-        interval_start = (
-            parse_datetime_cached(start_time_str) if start_time_str else None
-        )
         interval_start_utc = (
-            dt_util.as_utc(interval_start) if interval_start is not None else None
+            parse_datetime_utc_cached(start_time_str) if start_time_str else None
         )
 
         # Use coordinator's unified transport cost resolution (handles both built-in and legacy)
@@ -66,7 +66,7 @@ class SolarForecastService:
                 coordinator._solar_forecast_source = "missing_tomorrow_entity"
                 return None
 
-            live_value = await coordinator._get_state_value(tomorrow_entity)
+            live_value = coordinator._get_state_value(tomorrow_entity)
             # After start hour: refresh the cache once per hour (or if cache is empty).
             needs_refresh = (
                 coordinator._solar_forecast_cache_date != today
@@ -111,7 +111,7 @@ class SolarForecastService:
         # Before start hour: prefer the "today" entity (it now represents
         # the correct day after midnight) over the stale cache.
         if today_entity:
-            today_value = await coordinator._get_state_value(today_entity)
+            today_value = coordinator._get_state_value(today_entity)
             if today_value is not None:
                 coordinator._solar_forecast_source = "today_live"
                 _LOGGER.debug(
@@ -131,9 +131,7 @@ class SolarForecastService:
         # sunny-day decisions.  Return None to disable the feature
         # until the start hour when the cache can be populated.
         live_value = (
-            await coordinator._get_state_value(tomorrow_entity)
-            if tomorrow_entity
-            else None
+            coordinator._get_state_value(tomorrow_entity) if tomorrow_entity else None
         )
         if live_value is not None:
             reason = (
@@ -12,6 +12,7 @@ state). That dependency is passed in as a reference.
 from __future__ import annotations
 
 import logging
+from bisect import bisect_left
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
@@ -26,8 +27,9 @@ from .const import (
     DEFAULT_BUY_VAT_MULTIPLIER,
     DEFAULT_PRICE_ADJUSTMENT_MULTIPLIER,
     DEFAULT_PRICE_ADJUSTMENT_OFFSET,
+    INTERVAL_EXC_INFO_LOG_INTERVAL_SECONDS,
 )
-from .helpers import extract_price_from_interval, parse_datetime_cached
+from .helpers import ExcInfoThrottle, NordpoolPriceColumns, nordpool_price_columns
 
 if TYPE_CHECKING:
     from .coordinator import ElectricityPlannerCoordinator
@@ -43,6 +45,9 @@ class ThresholdCalculator:
 
     def __init__(self, coordinator: "ElectricityPlannerCoordinator") -> None:
         self._coordinator = coordinator
+        self._exc_info_throttle = ExcInfoThrottle(
+            INTERVAL_EXC_INFO_LOG_INTERVAL_SECONDS
+        )
         self.valid_count: int = 0
         self.enabled: bool = False
 
@@ -61,7 +66,6 @@ class ThresholdCalculator:
             return None
 
         now = dt_util.utcnow()
-        all_intervals: list[tuple[datetime, float]] = []
 
         config = self._coordinator.config
         multiplier = config.get(
@@ -74,171 +78,114 @@ class ThresholdCalculator:
             CONF_BUY_VAT_MULTIPLIER, DEFAULT_BUY_VAT_MULTIPLIER
         )
 
-        def process_intervals(
-            intervals: list[dict[str, Any]],
-            include_past: bool = False,
-            include_future: bool = True,
-        ) -> None:
-            """Process intervals and add them to ``all_intervals``."""
-            for interval in intervals:
-                try:
-                    start_time_str = interval.get("start")
-                    if not start_time_str:
-                        continue
-
-                    start_time = parse_datetime_cached(start_time_str)
-                    if start_time is None:
-                        continue
-                    start_time_utc = dt_util.as_utc(start_time)
-
-                    is_past = start_time_utc < now
-                    if is_past and not include_past:
-                        continue
-                    if not is_past and not include_future:
-                        continue
-
-                    price_value = extract_price_from_interval(interval)
-                    if price_value is None:
-                        continue
-
-                    price_kwh = price_value / 1000
-                    adjusted_price = (price_kwh * multiplier) + offset
-
-                    transport_cost = self._coordinator._resolve_transport_cost(
-                        transport_lookup, start_time_utc, reference_now=now
-                    )
-                    if transport_cost is None:
-                        transport_cost = 0.0
-
-                    final_price = (adjusted_price + transport_cost) * buy_vat_multiplier
-                    all_intervals.append((start_time_utc, final_price))
-
-                except (ValueError, TypeError, KeyError) as err:
-                    _LOGGER.debug(
-                        "Expected error processing interval for average threshold: %s",
-                        err,
-                    )
-                    continue
-                except Exception as err:
-                    if isinstance(err, (KeyboardInterrupt, SystemExit)):
-                        raise
-                    _LOGGER.warning(
-                        "Unexpected error processing interval for average threshold: %s",
-                        err,
-                        exc_info=True,
-                    )
-                    continue
-
-        def infer_interval_resolution() -> timedelta:
-            """Infer typical Nord Pool interval duration from provided data."""
-            deltas: list[timedelta] = []
-
-            def collect(intervals: list[dict[str, Any]]) -> None:
-                timestamps: list[datetime] = []
-                for interval in intervals:
-                    start_time_str = interval.get("start")
-                    if not start_time_str:
-                        continue
-                    start_time = parse_datetime_cached(start_time_str)
-                    if start_time is None:
-                        continue
-                    timestamps.append(dt_util.as_utc(start_time))
-
-                timestamps.sort()
-                for idx in range(1, len(timestamps)):
-                    delta = timestamps[idx] - timestamps[idx - 1]
-                    if delta > timedelta(0):
-                        deltas.append(delta)
-
-            if isinstance(prices_today, dict):
-                for intervals in prices_today.values():
-                    if isinstance(intervals, list):
-                        collect(intervals)
-
-            if isinstance(prices_tomorrow, dict):
-                for intervals in prices_tomorrow.values():
-                    if isinstance(intervals, list):
-                        collect(intervals)
-
-            if deltas:
-                return min(deltas)
-
-            # Default fallback: 15-minute intervals
-            return timedelta(minutes=15)
-
-        def collect_past_intervals(max_count: int) -> list[tuple[datetime, float]]:
-            """Collect recent past price intervals for backfilling."""
-            past_intervals: list[tuple[datetime, float]] = []
-
-            if not prices_today:
-                return past_intervals
-
-            area_code = next(iter(prices_today.keys()), None)
-            if not area_code or not isinstance(prices_today[area_code], list):
-                return past_intervals
-
-            for interval in prices_today[area_code]:
-                try:
-                    start_time_str = interval.get("start")
-                    if not start_time_str:
-                        continue
+        # Bind hot callables once; the closures below run per interval.
+        resolve_transport_cost = self._coordinator._resolve_transport_cost
 
-                    start_time = parse_datetime_cached(start_time_str)
-                    if start_time is None:
-                        continue
-                    start_time_utc = dt_util.as_utc(start_time)
+        def adjusted_price(start_time_utc: datetime, price_value: float) -> float:
+            """Apply adjustment, transport cost and VAT to a raw Nord Pool price."""
+            price_kwh = price_value / 1000
+            adjusted = (price_kwh * multiplier) + offset
 
-                    if start_time_utc >= now:
-                        continue
-
-                    price_value = extract_price_from_interval(interval)
-                    if price_value is None:
-                        continue
+            transport_cost = resolve_transport_cost(
+                transport_lookup, start_time_utc, reference_now=now
+            )
+            if transport_cost is None:
+                transport_cost = 0.0
+
+            return (adjusted + transport_cost) * buy_vat_multiplier
+
+        def guarded_adjusted_price(
+            start_time_utc: datetime, price_value: float
+        ) -> float | None:
+            """Return the adjusted price, or None if this entry cannot be priced."""
+            try:
+                return adjusted_price(start_time_utc, price_value)
+            except (ValueError, TypeError, KeyError) as err:
+                _LOGGER.debug(
+                    "Expected error processing interval for average threshold: %s",
+                    err,
+                )
+            except Exception as err:
+                if isinstance(err, (KeyboardInterrupt, SystemExit)):
+                    raise
+                _LOGGER.warning(
+                    "Unexpected error processing interval for average threshold: %s",
+                    err,
+                    exc_info=_LOGGER.isEnabledFor(logging.WARNING)
+                    and self._exc_info_throttle.allow(),
+                )
+            return None
 
-                    price_kwh = price_value / 1000
-                    adjusted_price = (price_kwh * multiplier) + offset
-                    transport_cost = self._coordinator._resolve_transport_cost(
-                        transport_lookup, start_time_utc, reference_now=now
-                    )
-                    if transport_cost is None:
-                        transport_cost = 0.0
-                    final_price = (adjusted_price + transport_cost) * buy_vat_multiplier
+        def partition_columns(
+            columns: NordpoolPriceColumns,
+        ) -> tuple[list[tuple[datetime, float]], list[tuple[datetime, float]]]:
+            """Split parsed columns into ``(past, future)`` at ``now``.
+
+            Future entries carry the final adjusted price. Past entries keep the
+            raw Nord Pool price so the (comparatively expensive) adjustment is
+            only applied to the slice actually used for backfilling.
+            """
+            starts, prices = columns.starts, columns.prices
+            split = bisect_left(starts, now)
+            past = list(zip(starts[:split], prices[:split]))
+            future: list[tuple[datetime, float]] = []
+            for start_time_utc, price_value in zip(starts[split:], prices[split:]):
+                final_price = guarded_adjusted_price(start_time_utc, price_value)
+                if final_price is not None:
+                    future.append((start_time_utc, final_price))
+
+            return past, future
+
+        def is_chronological(entries: list[tuple[datetime, float]]) -> bool:
+            """Return True when entries are already ordered by start time."""
+            return all(
+                entries[idx - 1][0] <= entries[idx][0] for idx in range(1, len(entries))
+            )
 
-                    past_intervals.append((start_time_utc, final_price))
-                except Exception as exc:
-                    if isinstance(exc, (KeyboardInterrupt, SystemExit)):
-                        raise
-                    continue
-
-            past_intervals.sort(key=lambda x: x[0], reverse=True)
-            limited = past_intervals[:max_count]
-            limited.reverse()
-            return limited
-
-        # Pass 1: Collect future intervals only
-        if prices_today:
-            area_code = next(iter(prices_today.keys()), None)
-            if area_code and isinstance(prices_today[area_code], list):
-                process_intervals(
-                    prices_today[area_code], include_past=False, include_future=True
+        def infer_interval_resolution(
+            *entry_lists: list[tuple[datetime, float]],
+        ) -> timedelta:
+            """Infer typical Nord Pool interval duration from parsed entries."""
+            timestamps = sorted(
+                start_time_utc
+                for entries in entry_lists
+                for start_time_utc, _ in entries
+            )
+            zero = timedelta(0)
+            deltas = [
+                delta
+                for delta in (
+                    timestamps[idx] - timestamps[idx - 1]
+                    for idx in range(1, len(timestamps))
                 )
+                if delta > zero
+            ]
+            if deltas:
+                return min(deltas)
 
-        if prices_tomorrow:
-            area_code = next(iter(prices_tomorrow.keys()), None)
-            if area_code and isinstance(prices_tomorrow[area_code], list):
-                process_intervals(
-                    prices_tomorrow[area_code], include_past=False, include_future=True
-                )
+            # Default fallback: 15-minute intervals
+            return timedelta(minutes=15)
 
-        all_intervals.sort(key=lambda x: x[0])
+        # Payloads are parsed into sorted columns once per Nord Pool fetch;
+        # today's columns split into past/future, tomorrow's only contribute
+        # future prices.
+        raw_past, future_intervals = partition_columns(
+            nordpool_price_columns(prices_today)
+        )
+        _, tomorrow_future = partition_columns(nordpool_price_columns(prices_tomorrow))
+        future_intervals.extend(tomorrow_future)
 
-        future_intervals = [(t, p) for t, p in all_intervals if t >= now]
+        # Each day's columns are sorted; only sort when the two days overlap.
+        if not is_chronological(future_intervals):
+            future_intervals.sort(key=lambda x: x[0])
 
         if not future_intervals:
             _LOGGER.warning("No future price intervals available for average threshold")
             return None
 
-        interval_duration = infer_interval_resolution()
+        # Resolution comes from the starts already parsed above rather than a
+        # second walk over every area of the raw payloads.
+        interval_duration = infer_interval_resolution(raw_past, future_intervals)
 
         if interval_duration <= timedelta(0):
             interval_duration = timedelta(minutes=15)
@@ -254,7 +201,16 @@ class ThresholdCalculator:
         # Pass 2: backfill with past intervals if necessary
         if len(future_intervals) < intervals_needed:
             past_intervals_needed = intervals_needed - len(future_intervals)
-            past_intervals = collect_past_intervals(past_intervals_needed)
+            # Walk back from the most recent past slot, skipping entries that
+            # cannot be priced, until enough valid slots are collected.
+            past_intervals: list[tuple[datetime, float]] = []
+            for start_time_utc, price_value in reversed(raw_past):
+                if len(past_intervals) >= past_intervals_needed:
+                    break
+                final_price = guarded_adjusted_price(start_time_utc, price_value)
+                if final_price is not None:
+                    past_intervals.append((start_time_utc, final_price))
+            past_intervals.reverse()
 
             if len(past_intervals) >= past_intervals_needed:
                 combined_intervals = past_intervals + future_intervals
@@ -292,8 +248,11 @@ class ThresholdCalculator:
             )
 
         if combined_intervals:
-            prices = [p for _, p in combined_intervals]
-            average = sum(prices) / len(prices)
+            # Sum as floats and round once for every return branch below.
+            average = sum(price for _, price in combined_intervals) / len(
+                combined_intervals
+            )
+            threshold = round(average, 4)
 
             has_sufficient_data = len(combined_intervals) >= intervals_needed
 
@@ -325,7 +284,7 @@ class ThresholdCalculator:
                     self.enabled,
                     self.valid_count,
                 )
-                return round(average, 4)
+                return threshold
 
             # Insufficient data for 24h minimum
             if self.enabled:
@@ -336,7 +295,7 @@ class ThresholdCalculator:
                     len(combined_intervals),
                     intervals_needed,
                 )
-                return round(average, 4)
+                return threshold
 
             _LOGGER.debug(
                 "Average threshold: insufficient data for %dh minimum "
@@ -346,7 +305,7 @@ class ThresholdCalculator:
                 intervals_needed,
             )
             self.valid_count = 0
-            return round(average, 4)
+            return threshold
 
         # No intervals available - reset
         if self.valid_count > 0 or self.enabled:
@@ -9,7 +9,10 @@ maintaining the cached lookup used by the price timeline builder.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timedelta
+from functools import partial
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
@@ -30,6 +33,10 @@ from .const import (
     DEFAULT_ENERGY_TAX_BIJDRAGE,
     DEFAULT_TRANSPORT_COST_DAY,
     DEFAULT_TRANSPORT_COST_NIGHT,
+    TRANSPORT_COST_LOOKUP_MAX_TTL_MINUTES,
+    TRANSPORT_COST_LOOKUP_MIN_TTL_MINUTES,
+    TRANSPORT_COST_LOOKUP_TTL_MINUTES,
+    TRANSPORT_COST_SETTLE_SECONDS,
 )
 from .helpers import (
     calculate_transport_cost_from_components,
@@ -42,6 +49,102 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+_UNAVAILABLE_STATES = frozenset((STATE_UNAVAILABLE, STATE_UNKNOWN))
+
+# Built once: these bounds are compared on every refresh.
+_HISTORY_WINDOW = timedelta(days=7)
+_DEFAULT_TTL = timedelta(minutes=TRANSPORT_COST_LOOKUP_TTL_MINUTES)
+_MIN_TTL = timedelta(minutes=TRANSPORT_COST_LOOKUP_MIN_TTL_MINUTES)
+_MAX_TTL = timedelta(minutes=TRANSPORT_COST_LOOKUP_MAX_TTL_MINUTES)
+
+# Recorded costs closer than this are treated as the same tariff (float noise
+# from template sensors); tariffs are never meaningful beyond 6 decimals.
+_COST_TOLERANCE = 1e-6
+
+
+def _iter_history_costs(rows: Iterable[Any]) -> Iterator[tuple[datetime, float]]:
+    """Yield ``(aware_timestamp, cost)`` for every usable recorder history row.
+
+    Recorder timestamps are already timezone-aware UTC. Only epoch seconds and
+    ordering are derived from them, and both are zone-independent, so only a
+    naive timestamp is normalised.
+    """
+    # Bind per-row callables once; 7 days of history can be thousands of rows.
+    parse_datetime = dt_util.parse_datetime
+    as_utc = dt_util.as_utc
+    for state in rows:
+        # minimal_response yields a full State for the first row and
+        # {"state", "last_changed"} dicts (ISO timestamp) afterwards.
+        if type(state) is dict:
+            value = state.get("state")
+            last_changed = state.get("last_changed")
+            if type(last_changed) is str:
+                last_changed = parse_datetime(last_changed)
+        else:
+            value = state.state
+            last_changed = state.last_changed
+        if value in _UNAVAILABLE_STATES:
+            continue
+        try:
+            cost = float(value)
+            if last_changed.tzinfo is None:
+                last_changed = as_utc(last_changed)
+        except (ValueError, TypeError, AttributeError):
+            continue
+        yield last_changed, cost
+
+
+def _collapse_history_changes(
+    history: Iterable[tuple[datetime, float]],
+) -> list[dict[str, Any]] | None:
+    """Build lookup entries from chronological ``(timestamp, cost)`` pairs.
+
+    Consecutive duplicate costs are skipped as they are read rather than
+    stripped afterwards, and a change superseded within
+    ``TRANSPORT_COST_SETTLE_SECONDS`` takes the settled cost instead of adding
+    an entry, so sensor stutter does not grow the lookup. Starts are stored as
+    UTC epoch seconds so resolving a cost is float comparison rather than ISO
+    parsing per entry per interval. Returns ``None`` as soon as a timestamp
+    goes backwards.
+    """
+    changes: list[dict[str, Any]] = []
+    append = changes.append
+    previous_timestamp: datetime | None = None
+    last_cost: float | None = None
+    for timestamp, cost in history:
+        if previous_timestamp is not None and timestamp < previous_timestamp:
+            return None
+        previous_timestamp = timestamp
+        if last_cost is not None and abs(cost - last_cost) <= _COST_TOLERANCE:
+            continue
+        start = timestamp.timestamp()
+        if changes and start - changes[-1]["start"] < TRANSPORT_COST_SETTLE_SECONDS:
+            stutter_start = changes.pop()["start"]
+            # A flip back to the cost before the stutter is no change at all.
+            if changes and abs(cost - changes[-1]["cost"]) <= _COST_TOLERANCE:
+                last_cost = changes[-1]["cost"]
+                continue
+            start = stutter_start
+        last_cost = cost
+        append({"start": start, "cost": cost})
+    return changes
+
+
+def _lookup_signature(changes: list[dict[str, Any]]) -> int:
+    """Hash a lookup's ``(start, cost)`` pairs for change detection.
+
+    The recorder stamps the first history row with the query window start,
+    which slides forward on every read, so only that row's cost is signed.
+    """
+    if not changes:
+        return hash(())
+    return hash(
+        (
+            changes[0]["cost"],
+            tuple((change["start"], change["cost"]) for change in changes[1:]),
+        )
+    )
+
 
 class TransportCostResolver:
     """Resolves transport costs and maintains recorder-history lookup cache."""
@@ -85,7 +188,7 @@ class TransportCostResolver:
             p1_entity = coordinator.config.get(CONF_P1_TARIFF_ENTITY)
             if p1_entity:
                 state = coordinator.hass.states.get(p1_entity)
-                if state and state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                if state and state.state not in _UNAVAILABLE_STATES:
                     p1_tariff_code = state.state
 
         day = (
@@ -137,10 +240,100 @@ class TransportCostResolver:
             }
         ]
 
+    def _adapt_ttl(self, changes: list[dict[str, Any]]) -> None:
+        """Stretch the refresh TTL while history is stable, shrink it on change."""
+        coordinator = self._coordinator
+        signature = _lookup_signature(changes)
+        previous = coordinator._transport_cost_lookup_signature
+        coordinator._transport_cost_lookup_signature = signature
+        if previous is None:
+            return
+
+        if signature == previous:
+            coordinator._transport_cost_ttl = min(
+                coordinator._transport_cost_ttl * 2, _MAX_TTL
+            )
+        else:
+            coordinator._transport_cost_ttl = max(
+                coordinator._transport_cost_ttl / 2, _MIN_TTL
+            )
+
+    def _count_cached_changes_since(self, window_start: datetime) -> int | None:
+        """Count cached history changes inside the refresh window.
+
+        Returns ``None`` when the cache holds no recorder history (empty or a
+        current-value fallback), in which case any fresh history replaces it.
+        """
+        coordinator = self._coordinator
+        if coordinator._transport_cost_status != "applied":
+            return None
+        window_start_ts = window_start.timestamp()
+        count = 0
+        for change in coordinator._transport_cost_lookup:
+            start = change.get("start")
+            if start is None:
+                return None
+            if start >= window_start_ts:
+                count += 1
+        return count
+
+    def _append_live_change(
+        self, transport_entity: str, current_transport_cost: float
+    ) -> list[dict[str, Any]] | None:
+        """Extend the cached history with the entity's live state in memory.
+
+        Returns the new lookup, or ``None`` when the live state cannot be
+        placed after the newest cached change and a recorder read is needed.
+        Changes older than the 7-day window are evicted, keeping the one in
+        effect at the window start as the baseline.
+        """
+        coordinator = self._coordinator
+        lookup = coordinator._transport_cost_lookup
+        state = coordinator.hass.states.get(transport_entity)
+        last_changed = getattr(state, "last_changed", None)
+        if last_changed is None:
+            return None
+        change_start = last_changed.timestamp()
+        if change_start <= lookup[-1]["start"]:
+            return None
+
+        window_start = (dt_util.now() - _HISTORY_WINDOW).timestamp()
+        keep_from = 0
+        while (
+            keep_from + 1 < len(lookup)
+            and lookup[keep_from + 1]["start"] <= window_start
+        ):
+            keep_from += 1
+
+        # Replace rather than mutate: cached columns are keyed on identity.
+        changes = lookup[keep_from:]
+        changes.append({"start": change_start, "cost": current_transport_cost})
+        coordinator._transport_cost_lookup = changes
+        coordinator._transport_cost_lookup_signature = _lookup_signature(changes)
+        return changes
+
+    def _reset_ttl(self) -> None:
+        """Return to the default refresh TTL when history is unavailable."""
+        coordinator = self._coordinator
+        coordinator._transport_cost_lookup_signature = None
+        coordinator._transport_cost_ttl = _DEFAULT_TTL
+
     async def get_lookup(
         self, current_transport_cost: float | None = None
     ) -> tuple[list[dict[str, Any]], str]:
-        """Return cached transport cost lookup built from recorder history."""
+        """Return cached transport cost lookup built from recorder history.
+
+        Overlapping refreshes queue on the coordinator's lock; a follower
+        re-runs the cache checks after the leader's rebuild and is served
+        from the fresh cache instead of issuing its own recorder query.
+        """
+        async with self._coordinator._transport_cost_lock:
+            return await self._get_lookup(current_transport_cost)
+
+    async def _get_lookup(
+        self, current_transport_cost: float | None
+    ) -> tuple[list[dict[str, Any]], str]:
+        """Resolve the lookup; callers must hold the transport cost lock."""
         coordinator = self._coordinator
         transport_entity = coordinator.config.get(CONF_TRANSPORT_COST_ENTITY)
         if not transport_entity:
@@ -149,59 +342,73 @@ class TransportCostResolver:
             return [], "not_configured"
 
         now = dt_util.utcnow()
-        # Refresh every 30 minutes at most
+        # Refresh at most once per (adaptive) TTL
         if (
             coordinator._transport_cost_lookup_time
-            and now - coordinator._transport_cost_lookup_time < timedelta(minutes=30)
+            and now - coordinator._transport_cost_lookup_time
+            < coordinator._transport_cost_ttl
         ):
             cached_cost = (
                 coordinator._transport_cost_lookup[0].get("cost")
                 if coordinator._transport_cost_lookup
                 else None
             )
-            if not (
+            # A long TTL must not hide a fresh change: refresh early when the
+            # live value no longer matches the newest recorded cost.
+            latest_cost = (
+                coordinator._transport_cost_lookup[-1].get("cost")
+                if coordinator._transport_cost_lookup
+                else None
+            )
+            stale_fallback = (
                 coordinator._transport_cost_status
                 in {"fallback_current", "pending_history"}
                 and cached_cost != current_transport_cost
-            ):
+            )
+            stale_history = (
+                coordinator._transport_cost_status == "applied"
+                and now - coordinator._transport_cost_lookup_time >= _MIN_TTL
+                and current_transport_cost is not None
+                and latest_cost is not None
+                and abs(latest_cost - current_transport_cost) > 1e-9
+            )
+            if not (stale_fallback or stale_history):
                 return (
                     coordinator._transport_cost_lookup,
                     coordinator._transport_cost_status,
                 )
-
-        try:
-            try:
-                from homeassistant.components.recorder import (
-                    get_instance as get_recorder_instance,
-                )
-            except ImportError:
-                get_recorder_instance = (
-                    None  # Older HA or test shims may not expose get_instance
+            # A live change after the recorded history is appended in memory;
+            # the TTL still forces a periodic full rebuild from the recorder.
+            if stale_history:
+                changes = self._append_live_change(
+                    transport_entity, current_transport_cost
                 )
+                if changes is not None:
+                    return changes, coordinator._transport_cost_status
 
+        try:
+            # History reads are database I/O: always run them on the recorder's
+            # own executor rather than Home Assistant's shared pool.
+            from homeassistant.components.recorder import get_instance
             from homeassistant.components.recorder.history import get_significant_states
 
             end_time = dt_util.now()
-            start_time = end_time - timedelta(days=7)
+            start_time = end_time - _HISTORY_WINDOW
 
-            if get_recorder_instance is not None:
-                recorder = get_recorder_instance(coordinator.hass)
-                states = await recorder.async_add_executor_job(
-                    get_significant_states,
-                    coordinator.hass,
-                    start_time,
-                    end_time,
-                    [transport_entity],
-                )
-            else:
-                # Fallback for environments without recorder.get_instance (tests/shims)
-                states = await coordinator.hass.async_add_executor_job(
+            # Only state values and change times are used: skip attribute
+            # hydration and let the recorder return compact rows.
+            states = await get_instance(coordinator.hass).async_add_executor_job(
+                partial(
                     get_significant_states,
                     coordinator.hass,
                     start_time,
                     end_time,
                     [transport_entity],
+                    significant_changes_only=True,
+                    minimal_response=True,
+                    no_attributes=True,
                 )
+            )
 
             if not states or transport_entity not in states:
                 fallback_lookup = self.build_fallback_lookup(current_transport_cost)
@@ -222,45 +429,41 @@ class TransportCostResolver:
                         transport_entity,
                     )
                 coordinator._transport_cost_lookup_time = now
+                self._reset_ttl()
                 return (
                     coordinator._transport_cost_lookup,
                     coordinator._transport_cost_status,
                 )
 
-            # First collect all valid cost changes with timestamps. Pre-parse
-            # the local-time representation here so resolve() doesn't have to
-            # call dt_util.parse_datetime() once per entry per interval (the
-            # 192-interval timeline rebuild would otherwise spend ~134 k
-            # ISO-8601 parses per cycle on a full 7-day history lookup).
-            raw_changes: list[dict[str, Any]] = []
-            for state in states[transport_entity]:
-                value = state.state
-                if value in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-                    continue
-                try:
-                    cost = float(value)
-                    timestamp = dt_util.as_utc(state.last_changed)
-                    raw_changes.append(
-                        {
-                            "start": timestamp.isoformat(),
-                            "cost": cost,
-                            "_local": dt_util.as_local(timestamp),
-                        }
-                    )
-                except (ValueError, TypeError, AttributeError):
-                    continue
-
-            # Sort by timestamp first
-            raw_changes.sort(key=lambda entry: entry["start"])
+            # Parse and collapse consecutive duplicate costs in one pass. The
+            # recorder returns rows ordered by time; only if a history source
+            # ever hands them over out of order are they sorted and re-walked.
+            rows = states[transport_entity]
+            changes = _collapse_history_changes(_iter_history_costs(rows))
+            if changes is None:
+                changes = _collapse_history_changes(
+                    sorted(_iter_history_costs(rows), key=itemgetter(0))
+                )
 
-            # Then remove duplicate consecutive values
-            changes: list[dict[str, Any]] = []
-            last_cost: float | None = None
-            for change in raw_changes:
-                cost = change["cost"]
-                if last_cost is None or abs(cost - last_cost) > 1e-9:
-                    changes.append(change)
-                    last_cost = cost
+            self._adapt_ttl(changes)
+            cached_in_window = self._count_cached_changes_since(start_time)
+            if cached_in_window is not None and len(changes) < cached_in_window:
+                # The recorder returned less history than we already hold for
+                # the same window (e.g. during database maintenance); keep the
+                # richer lookup instead of letting the cache go backwards.
+                _LOGGER.debug(
+                    "Transport cost history for %s returned %d changes, fewer than "
+                    "the %d cached for the same window; keeping cached lookup",
+                    transport_entity,
+                    len(changes),
+                    cached_in_window,
+                )
+                coordinator._transport_cost_status = "applied"
+                coordinator._transport_cost_lookup_time = now
+                return (
+                    coordinator._transport_cost_lookup,
+                    coordinator._transport_cost_status,
+                )
 
             coordinator._transport_cost_lookup = changes
             coordinator._transport_cost_status = (
@@ -305,6 +508,7 @@ class TransportCostResolver:
                     err,
                 )
             coordinator._transport_cost_lookup_time = now
+            self._reset_ttl()
             return (
                 coordinator._transport_cost_lookup,
                 coordinator._transport_cost_status,
@@ -6,7 +6,7 @@ import asyncio
 import sys
 from datetime import datetime, timedelta, timezone
 from types import ModuleType, SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import pytz
@@ -321,6 +321,20 @@ async def test_fetch_all_data_computes_surplus_and_filters_unavailable(
     assert data["car_charging_power"] == 1400.0
 
 
+def test_entity_fetch_plan_rebuilds_when_config_is_replaced(fake_hass, monkeypatch):
+    config = _base_config()
+    coordinator = _create_coordinator(fake_hass, config, monkeypatch)
+
+    plan = coordinator._entity_fetch_plan()
+    assert coordinator._entity_fetch_plan() is plan
+    assert plan.prices[0] == ("current_price", "sensor.current_price")
+
+    coordinator.config = {**coordinator.config, CONF_CAR_CHARGING_POWER_ENTITY: None}
+    rebuilt = coordinator._entity_fetch_plan()
+    assert rebuilt is not plan
+    assert rebuilt.car_entity is None
+
+
 @pytest.mark.asyncio
 async def test_fetch_all_data_three_phase_aggregates(fake_hass, monkeypatch):
     config = _three_phase_config()
@@ -494,22 +508,21 @@ async def test_async_update_data_merges_decisions(fake_hass, monkeypatch):
             "price_analysis": {"data_available": True},
         }
     )
-    coordinator._check_data_availability = AsyncMock()
+    coordinator._check_data_availability = MagicMock()
 
     result = await coordinator._async_update_data()
 
     assert result["battery_grid_charging"] is True
     coordinator._fetch_all_data.assert_awaited_once()
     coordinator.decision_engine.evaluate_charging_decision.assert_awaited_once()
-    coordinator._check_data_availability.assert_awaited_once()
+    coordinator._check_data_availability.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_data_unavailability_triggers_notifications(fake_hass, monkeypatch):
+def test_data_unavailability_triggers_notifications(fake_hass, monkeypatch):
     config = _base_config()
     coordinator = _create_coordinator(fake_hass, config, monkeypatch)
 
-    send_notification = AsyncMock()
+    send_notification = MagicMock()
     monkeypatch.setattr(coordinator, "_send_notification", send_notification)
 
     base_time = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
@@ -520,22 +533,21 @@ async def test_data_unavailability_triggers_notifications(fake_hass, monkeypatch
 
     unavailable = {"current_price": None, "price_analysis": {}}
 
-    await coordinator._check_data_availability(unavailable)
+    coordinator._check_data_availability(unavailable)
     assert coordinator.data_unavailable_since == base_time
     send_notification.assert_not_called()
 
     now_ref["value"] = base_time + timedelta(seconds=70)
-    await coordinator._check_data_availability(unavailable)
-    send_notification.assert_awaited_once()
+    coordinator._check_data_availability(unavailable)
+    send_notification.assert_called_once()
     assert coordinator.notification_sent is True
 
 
-@pytest.mark.asyncio
-async def test_short_outage_does_not_emit_restored_notification(fake_hass, monkeypatch):
+def test_short_outage_does_not_emit_restored_notification(fake_hass, monkeypatch):
     """Short blips should not generate a misleading recovery notification."""
     coordinator = _create_coordinator(fake_hass, _base_config(), monkeypatch)
 
-    send_notification = AsyncMock()
+    send_notification = MagicMock()
     monkeypatch.setattr(coordinator, "_send_notification", send_notification)
 
     base_time = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
@@ -552,29 +564,65 @@ async def test_short_outage_does_not_emit_restored_notification(fake_hass, monke
         "price_analysis": {"data_available": True},
     }
 
-    await coordinator._check_data_availability(unavailable)
+    coordinator._check_data_availability(unavailable)
     now_ref["value"] = base_time + timedelta(seconds=10)
-    await coordinator._check_data_availability(available)
+    coordinator._check_data_availability(available)
 
-    send_notification.assert_not_awaited()
+    send_notification.assert_not_called()
     assert coordinator.notification_sent is False
     assert coordinator.data_unavailable_since is None
 
 
+def test_send_notification_creates_persistent_notification(
+    fake_hass, monkeypatch
+):
+    coordinator = _create_coordinator(fake_hass, _base_config(), monkeypatch)
+    created = []
+    monkeypatch.setattr(
+        coordinator_module.persistent_notification,
+        "async_create",
+        lambda hass, message, title=None, notification_id=None: created.append(
+            (hass, message, title, notification_id)
+        ),
+    )
+
+    coordinator._send_notification("Title", "Body", "planner_note")
+
+    assert created == [(fake_hass, "Body", "Title", "planner_note")]
+    assert fake_hass.services.calls == []
+
+
 def _event_for(entity_id: str):
     return SimpleNamespace(data={"entity_id": entity_id})
 
 
+def _capture_call_later(monkeypatch) -> list[dict]:
+    """Record trailing refreshes scheduled through ``async_call_later``."""
+    scheduled: list[dict] = []
+
+    def fake_call_later(hass, delay, action):
+        handle = {"delay": delay, "action": action, "cancelled": False}
+        scheduled.append(handle)
+
+        def cancel():
+            handle["cancelled"] = True
+
+        return cancel
+
+    monkeypatch.setattr(coordinator_module, "async_call_later", fake_call_later)
+    return scheduled
+
+
 @pytest.mark.asyncio
 async def test_handle_entity_change_respects_throttle(fake_hass, monkeypatch):
     config = _base_config()
     coordinator = _create_coordinator(fake_hass, config, monkeypatch)
 
-    base_time = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
-    clock = {"now": base_time}
+    clock = {"now_ns": 1_000_000_000_000}
     monkeypatch.setattr(
-        coordinator_module.dt_util, "utcnow", lambda: clock["now"], raising=False
+        coordinator_module.time, "monotonic_ns", lambda: clock["now_ns"]
     )
+    scheduled = _capture_call_later(monkeypatch)
 
     coordinator.async_request_refresh = AsyncMock()
     tasks: list[asyncio.Task] = []
@@ -596,7 +644,7 @@ async def test_handle_entity_change_respects_throttle(fake_hass, monkeypatch):
     assert len(tasks) == 1
     assert coordinator.async_request_refresh.await_count == 1
 
-    clock["now"] = base_time + timedelta(seconds=5)
+    clock["now_ns"] += 5_000_000_000
     coordinator._handle_entity_change(event)
     # Task is created but throttled inside _async_handle_throttled_update
     for task in tasks[1:]:
@@ -604,13 +652,34 @@ async def test_handle_entity_change_respects_throttle(fake_hass, monkeypatch):
     assert len(tasks) == 2
     # Refresh should still be 1 because the second call was throttled
     assert coordinator.async_request_refresh.await_count == 1
+    # ...but a trailing refresh is scheduled for when the window closes
+    assert [handle["delay"] for handle in scheduled] == [5.0]
 
-    clock["now"] = base_time + timedelta(seconds=15)
+    clock["now_ns"] += 10_000_000_000
     coordinator._handle_entity_change(event)
     for task in tasks[2:]:
         await task
     assert len(tasks) == 3
     assert coordinator.async_request_refresh.await_count == 2
+    # The immediate refresh supersedes the pending trailing one
+    assert scheduled[0]["cancelled"] is True
+    assert coordinator._pending_refresh_unsub is None
+
+
+def test_collect_tracked_entity_ids_deduplicates_shared_entities(
+    fake_hass, monkeypatch
+):
+    """An entity configured in several slots is tracked once, in order."""
+    config = _three_phase_config()
+    config[CONF_GRID_POWER_ENTITY] = "sensor.load_l1"
+    config[CONF_PHASES]["phase_2"][CONF_PHASE_CONSUMPTION_ENTITY] = "sensor.load_l1"
+    coordinator = _create_coordinator(fake_hass, config, monkeypatch)
+
+    tracked = coordinator._collect_tracked_entity_ids()
+
+    assert tracked.count("sensor.load_l1") == 1
+    assert len(tracked) == len(set(tracked))
+    assert tracked.index("sensor.current_price") < tracked.index("sensor.load_l1")
 
 
 @pytest.mark.asyncio
@@ -620,11 +689,11 @@ async def test_handle_entity_change_includes_three_phase_entities(
     config = _three_phase_config()
     coordinator = _create_coordinator(fake_hass, config, monkeypatch)
 
-    base_time = datetime(2024, 2, 1, 8, 0, tzinfo=timezone.utc)
-    clock = {"now": base_time}
+    clock = {"now_ns": 1_000_000_000_000}
     monkeypatch.setattr(
-        coordinator_module.dt_util, "utcnow", lambda: clock["now"], raising=False
+        coordinator_module.time, "monotonic_ns", lambda: clock["now_ns"]
     )
+    scheduled = _capture_call_later(monkeypatch)
 
     coordinator.async_request_refresh = AsyncMock()
     tasks: list[asyncio.Task] = []
@@ -647,7 +716,7 @@ async def test_handle_entity_change_includes_three_phase_entities(
     assert coordinator.async_request_refresh.await_count == 1
 
     # Throttle still applies for rapid subsequent updates
-    clock["now"] = base_time + timedelta(seconds=5)
+    clock["now_ns"] += 5_000_000_000
     coordinator._handle_entity_change(event)
     # Task is created but throttled inside _async_handle_throttled_update
     for task in tasks[1:]:
@@ -655,13 +724,18 @@ async def test_handle_entity_change_includes_three_phase_entities(
     assert len(tasks) == 2
     # Refresh should still be 1 because the second call was throttled
     assert coordinator.async_request_refresh.await_count == 1
+    # ...but a trailing refresh is scheduled for when the window closes
+    assert [handle["delay"] for handle in scheduled] == [5.0]
 
-    clock["now"] = base_time + timedelta(seconds=15)
+    clock["now_ns"] += 10_000_000_000
     coordinator._handle_entity_change(event)
     for task in tasks[2:]:
         await task
     assert len(tasks) == 3
     assert coordinator.async_request_refresh.await_count == 2
+    # The immediate refresh supersedes the pending trailing one
+    assert scheduled[0]["cancelled"] is True
+    assert coordinator._pending_refresh_unsub is None
 
 
 @pytest.mark.asyncio
@@ -671,11 +745,11 @@ async def test_throttled_update_does_not_retrigger_after_slow_refresh(
     """Events that arrive inside the throttle window should stay throttled even if refresh is slow."""
     coordinator = _create_coordinator(fake_hass, _base_config(), monkeypatch)
 
-    base_time = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
-    clock = {"now": base_time}
+    clock = {"now_ns": 1_000_000_000_000}
     monkeypatch.setattr(
-        coordinator_module.dt_util, "utcnow", lambda: clock["now"], raising=False
+        coordinator_module.time, "monotonic_ns", lambda: clock["now_ns"]
     )
+    scheduled = _capture_call_later(monkeypatch)
 
     first_refresh_started = asyncio.Event()
     release_first_refresh = asyncio.Event()
@@ -695,18 +769,19 @@ async def test_throttled_update_does_not_retrigger_after_slow_refresh(
     )
     await first_refresh_started.wait()
 
-    clock["now"] = base_time + timedelta(seconds=5)
+    clock["now_ns"] += 5_000_000_000
     second_task = asyncio.create_task(
         coordinator._async_handle_throttled_update("sensor.current_price")
     )
     await asyncio.sleep(0)
 
-    clock["now"] = base_time + timedelta(seconds=15)
+    clock["now_ns"] += 10_000_000_000
     release_first_refresh.set()
 
     await asyncio.gather(first_task, second_task)
 
     assert coordinator.async_request_refresh.await_count == 1
+    assert len(scheduled) == 1
 
 
 @pytest.mark.asyncio
@@ -719,6 +794,7 @@ async def test_handle_entity_change_triggers_for_peak_and_tariff_entities(
     config[CONF_GRID_POWER_ENTITY] = "sensor.grid_power"
     config[CONF_P1_TARIFF_ENTITY] = "sensor.p1_tariff"
     coordinator = _create_coordinator(fake_hass, config, monkeypatch)
+    scheduled = _capture_call_later(monkeypatch)
 
     base_time = datetime(2024, 2, 1, 8, 0, tzinfo=timezone.utc)
     clock = {"now": base_time}
@@ -744,6 +820,38 @@ async def test_handle_entity_change_triggers_for_peak_and_tariff_entities(
 
     assert len(tasks) == 2
     assert coordinator.async_request_refresh.await_count == 1
+    assert len(scheduled) == 1
+
+
+@pytest.mark.asyncio
+async def test_trailing_refresh_runs_after_throttle_window(fake_hass, monkeypatch):
+    """A change inside the throttle window is refreshed once the window closes."""
+    coordinator = _create_coordinator(fake_hass, _base_config(), monkeypatch)
+
+    clock = {"now_ns": 1_000_000_000_000}
+    monkeypatch.setattr(
+        coordinator_module.time, "monotonic_ns", lambda: clock["now_ns"]
+    )
+    scheduled = _capture_call_later(monkeypatch)
+    coordinator.async_request_refresh = AsyncMock()
+
+    await coordinator._async_handle_throttled_update("sensor.current_price")
+    clock["now_ns"] += 2_000_000_000
+    await coordinator._async_handle_throttled_update("sensor.current_price")
+    clock["now_ns"] += 1_000_000_000
+    await coordinator._async_handle_throttled_update("sensor.current_price")
+
+    # Burst collapses into a single trailing refresh
+    assert [handle["delay"] for handle in scheduled] == [8.0]
+    assert coordinator.async_request_refresh.await_count == 1
+
+    clock["now_ns"] += 7_000_000_000
+    scheduled[0]["action"](None)
+    await asyncio.sleep(0)
+
+    assert coordinator.async_request_refresh.await_count == 2
+    assert coordinator._pending_refresh_unsub is None
+    assert coordinator._last_entity_update_ns == clock["now_ns"]
 
 
 def test_get_current_price_interval_start_uses_active_timeline(fake_hass, monkeypatch):
@@ -849,18 +957,24 @@ async def test_nordpool_cache_prevents_redundant_calls(fake_hass, monkeypatch):
     assert fake_hass.services.async_call.await_count == 1
     assert result1 == mock_response
 
-    # Second call within 5 minutes - should use cache
+    # Second call a few minutes later - should use cache
     clock["now"] = base_time + timedelta(minutes=2)
     result2 = await coordinator._fetch_nordpool_prices("test_config_entry_id", "today")
     assert fake_hass.services.async_call.await_count == 1  # Still 1, not called again
     assert result2 == mock_response
 
-    # Third call after 5 minutes - should hit service again
-    clock["now"] = base_time + timedelta(minutes=6)
+    # Later in the same hour - prices cannot have changed, still cached
+    clock["now"] = base_time + timedelta(minutes=59)
     result3 = await coordinator._fetch_nordpool_prices("test_config_entry_id", "today")
-    assert fake_hass.services.async_call.await_count == 2  # Called again
+    assert fake_hass.services.async_call.await_count == 1
     assert result3 == mock_response
 
+    # Just past the next hour boundary - should hit service again
+    clock["now"] = base_time + timedelta(hours=1, seconds=31)
+    result4 = await coordinator._fetch_nordpool_prices("test_config_entry_id", "today")
+    assert fake_hass.services.async_call.await_count == 2  # Called again
+    assert result4 == mock_response
+
 
 @pytest.mark.asyncio
 async def test_nordpool_cache_rolls_over_at_midnight(fake_hass, monkeypatch):
@@ -916,6 +1030,50 @@ async def test_nordpool_handles_service_failure(fake_hass, monkeypatch):
     assert fake_hass.services.async_call.await_count == 3
 
 
+@pytest.mark.asyncio
+async def test_nordpool_failure_falls_back_to_stale_cache(
+    fake_hass, monkeypatch, caplog
+):
+    """A failed refetch keeps serving the last good prices, flagged as stale."""
+    coordinator = _create_coordinator(fake_hass, _base_config(), monkeypatch)
+
+    base_time = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    clock = {"now": base_time}
+    monkeypatch.setattr(
+        coordinator_module.dt_util, "utcnow", lambda: clock["now"], raising=False
+    )
+    monkeypatch.setattr(
+        coordinator_module.dt_util, "now", lambda: clock["now"], raising=False
+    )
+    monkeypatch.setattr(coordinator_module.asyncio, "sleep", AsyncMock())
+
+    good = {"BE": [{"start": "2024-01-01T12:00:00+00:00", "price": 100.0}]}
+    fake_hass.services.async_call = AsyncMock(return_value=good)
+    assert await coordinator._fetch_nordpool_prices("entry", "today") is good
+
+    clock["now"] = base_time + timedelta(hours=2)
+    # The expiry sweep keeps expired entries for today as a fallback
+    coordinator._clean_expired_nordpool_cache()
+    fake_hass.services.async_call = AsyncMock(
+        side_effect=Exception("Service unavailable")
+    )
+
+    assert await coordinator._fetch_nordpool_prices("entry", "today") is good
+    assert fake_hass.services.async_call.await_count == 3
+    assert coordinator._nordpool_stale_days == {"today"}
+    assert "Using stale Nord Pool prices for today (age: 120.0 minutes)" in caplog.text
+
+    # A successful fetch clears the stale flag again
+    fake_hass.services.async_call = AsyncMock(return_value=good)
+    assert await coordinator._fetch_nordpool_prices("entry", "today") is good
+    assert coordinator._nordpool_stale_days == set()
+
+    # Past dates are still evicted once expired
+    clock["now"] = base_time + timedelta(days=1)
+    coordinator._clean_expired_nordpool_cache()
+    assert coordinator._nordpool_cache == {}
+
+
 @pytest.mark.asyncio
 async def test_fetch_all_data_includes_nordpool_prices(fake_hass, monkeypatch):
     """Test that _fetch_all_data includes Nord Pool price data when configured."""
@@ -990,6 +1148,7 @@ async def test_fetch_all_data_includes_nordpool_prices(fake_hass, monkeypatch):
     assert "BE" in data["nordpool_prices_tomorrow"]
     assert data["nordpool_prices_today"]["BE"][0]["price"] == 100.0
     assert data["nordpool_prices_tomorrow"]["BE"][0]["price"] == 110.0
+    assert data["nordpool_prices_stale"] == []
 
 
 def _make_price_interval(start, value):
@@ -1141,6 +1300,82 @@ def test_calculate_average_threshold_insufficient_past_uses_future_only(
     assert result == pytest.approx(0.1219, rel=1e-6)
 
 
+def test_calculate_average_threshold_pins_rounded_value(fake_hass, monkeypatch):
+    """The threshold is the float mean rounded once to 4 decimals."""
+    base_time = datetime(2025, 10, 14, 12, 0, tzinfo=timezone.utc)
+    _freeze_time(monkeypatch, base_time)
+
+    coordinator = _create_coordinator(fake_hass, _base_config(), monkeypatch)
+    intervals = [
+        _make_price_interval(
+            base_time + timedelta(hours=hour), 123.45 if hour % 2 else 67.891
+        )
+        for hour in range(24)
+    ]
+
+    result = coordinator._calculate_average_threshold({"BE": intervals}, None, None)
+
+    # mean(0.12345, 0.067891) * 1.06 VAT = 0.10141073 -> 0.1014
+    assert result == 0.1014
+
+
+def test_calculate_average_threshold_backfill_skips_malformed_entries(
+    fake_hass, monkeypatch
+):
+    """A past slot that cannot be priced is skipped, not raised."""
+    base_time = datetime(2025, 10, 14, 12, 0, tzinfo=timezone.utc)
+    _freeze_time(monkeypatch, base_time)
+
+    coordinator = _create_coordinator(fake_hass, _base_config(), monkeypatch)
+    bad_start = base_time - timedelta(hours=1)
+
+    def resolve_transport_cost(lookup, start_time_utc, reference_now=None):
+        if start_time_utc == bad_start:
+            raise ValueError("corrupt transport entry")
+        return None
+
+    coordinator._resolve_transport_cost = resolve_transport_cost
+
+    intervals = [
+        _make_price_interval(base_time + timedelta(hours=offset), price)
+        for offset, price in [(-3, 100.0), (-2, 100.0), (-1, 500.0)]
+        + [(hour, 200.0) for hour in range(23)]
+    ]
+    intervals.insert(0, {"start": "not-a-timestamp", "value": "n/a"})
+
+    result = coordinator._calculate_average_threshold({"BE": intervals}, None, None)
+    # The unpriceable -1h slot is skipped; -2h backfills the 24th hour
+    assert result == pytest.approx((100.0 + 23 * 200.0) / 24 / 1000 * 1.06, rel=1e-4)
+
+
+def test_calculate_average_threshold_infers_resolution_from_primary_area(
+    fake_hass, monkeypatch
+):
+    """Only the consumed area's starts determine the interval resolution."""
+    base_time = datetime(2025, 10, 14, 12, 0, tzinfo=timezone.utc)
+    _freeze_time(monkeypatch, base_time)
+
+    coordinator = _create_coordinator(fake_hass, _base_config(), monkeypatch)
+
+    # Hourly primary area: 3 past slots and 23 future slots
+    primary = [
+        _make_price_interval(base_time + timedelta(hours=offset), price)
+        for offset, price in [(-3, 100.0), (-2, 100.0), (-1, 100.0)]
+        + [(hour, 200.0) for hour in range(23)]
+    ]
+    # A finer-grained secondary area must not shrink the inferred resolution
+    secondary = [
+        _make_price_interval(base_time + timedelta(minutes=5 * step), 999.0)
+        for step in range(4)
+    ]
+
+    result = coordinator._calculate_average_threshold(
+        {"BE": primary, "NL": secondary}, None, None
+    )
+    # 24 hourly slots: one backfilled past hour + 23 future hours, with VAT
+    assert result == pytest.approx(0.2076, rel=1e-6)
+
+
 @pytest.mark.parametrize("use_average", [True, False])
 def test_check_minimum_charging_window(fake_hass, monkeypatch, use_average):
     """Charging window detection honors threshold selection and interval continuity."""
@@ -1268,7 +1503,7 @@ async def test_async_update_data_masks_average_threshold_until_enabled(
         }
     )
     coordinator.decision_engine.evaluate_charging_decision = AsyncMock(return_value={})
-    coordinator._check_data_availability = AsyncMock()
+    coordinator._check_data_availability = MagicMock()
 
     await coordinator._async_update_data()
 
@@ -2841,6 +3076,22 @@ async def test_service_accepts_explicit_entry(fake_hass, monkeypatch):
     coordinator.async_request_refresh.assert_awaited_once()
 
 
+def _install_fake_recorder(monkeypatch, fake_history):
+    """Route recorder history imports to *fake_history* for the test."""
+    fake_recorder = ModuleType("homeassistant.components.recorder")
+    fake_history_module = ModuleType("homeassistant.components.recorder.history")
+    fake_history_module.get_significant_states = fake_history
+    fake_recorder.history = fake_history_module
+    fake_recorder.get_instance = lambda hass: hass
+
+    monkeypatch.setitem(sys.modules, "homeassistant.components.recorder", fake_recorder)
+    monkeypatch.setitem(
+        sys.modules,
+        "homeassistant.components.recorder.history",
+        fake_history_module,
+    )
+
+
 @pytest.mark.asyncio
 async def test_transport_cost_lookup_uses_local_hour(fake_hass, monkeypatch):
     """Recorded transport costs should map to local hours, not UTC."""
@@ -2858,7 +3109,7 @@ async def test_transport_cost_lookup_uses_local_hour(fake_hass, monkeypatch):
         midnight_utc = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
         sample_state = SimpleNamespace(state="0.05", last_changed=midnight_utc)
 
-        def fake_history(hass, start_time, end_time, entities):
+        def fake_history(hass, start_time, end_time, entities, **kwargs):
             assert entities == ["sensor.transport_cost"]
             return {"sensor.transport_cost": [sample_state]}
 
@@ -2866,6 +3117,7 @@ async def test_transport_cost_lookup_uses_local_hour(fake_hass, monkeypatch):
         fake_history_module = ModuleType("homeassistant.components.recorder.history")
         fake_history_module.get_significant_states = fake_history
         fake_recorder.history = fake_history_module
+        fake_recorder.get_instance = lambda hass: hass
 
         monkeypatch.setitem(
             sys.modules, "homeassistant.components.recorder", fake_recorder
@@ -2882,12 +3134,49 @@ async def test_transport_cost_lookup_uses_local_hour(fake_hass, monkeypatch):
         assert len(lookup) == 1
         change = lookup[0]
         assert change["cost"] == pytest.approx(0.05, rel=1e-6)
-        change_start = dt_util.as_local(dt_util.parse_datetime(change["start"]))
+        change_start = dt_util.as_local(dt_util.utc_from_timestamp(change["start"]))
         assert change_start.hour == 1
     finally:
         dt_util.set_default_time_zone(original_tz)
 
 
+@pytest.mark.asyncio
+async def test_transport_cost_lookup_reads_minimal_history_rows(
+    fake_hass, monkeypatch
+):
+    """Minimal-response history rows (dicts after the first State) are parsed."""
+    base_time = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+    _freeze_time(monkeypatch, base_time)
+
+    config = _base_config()
+    config[CONF_TRANSPORT_COST_ENTITY] = "sensor.transport_cost"
+    coordinator = _create_coordinator(fake_hass, config, monkeypatch)
+
+    first_state = SimpleNamespace(
+        state="0.05", last_changed=datetime(2024, 12, 30, 0, 0, tzinfo=timezone.utc)
+    )
+    history_kwargs: dict = {}
+
+    def fake_history(hass, start_time, end_time, entities, **kwargs):
+        history_kwargs.update(kwargs)
+        return {
+            "sensor.transport_cost": [
+                first_state,
+                {"state": "unavailable", "last_changed": "2024-12-30T06:00:00+00:00"},
+                {"state": "0.08", "last_changed": "2024-12-30T07:00:00+00:00"},
+            ]
+        }
+
+    _install_fake_recorder(monkeypatch, fake_history)
+
+    lookup, status = await coordinator._get_transport_cost_lookup(0.05)
+
+    assert history_kwargs["minimal_response"] is True
+    assert history_kwargs["no_attributes"] is True
+    assert status == "applied"
+    assert [change["cost"] for change in lookup] == pytest.approx([0.05, 0.08])
+
+
 @pytest.mark.asyncio
 async def test_transport_cost_lookup_refreshes_fallback_when_current_cost_changes(
     fake_hass,
@@ -2901,7 +3190,7 @@ async def test_transport_cost_lookup_refreshes_fallback_when_current_cost_change
     config[CONF_TRANSPORT_COST_ENTITY] = "sensor.transport_cost"
     coordinator = _create_coordinator(fake_hass, config, monkeypatch)
 
-    def fake_history(hass, start_time, end_time, entities):
+    def fake_history(hass, start_time, end_time, entities, **kwargs):
         assert entities == ["sensor.transport_cost"]
         return {}
 
@@ -2909,6 +3198,7 @@ async def test_transport_cost_lookup_refreshes_fallback_when_current_cost_change
     fake_history_module = ModuleType("homeassistant.components.recorder.history")
     fake_history_module.get_significant_states = fake_history
     fake_recorder.history = fake_history_module
+    fake_recorder.get_instance = lambda hass: hass
 
     monkeypatch.setitem(sys.modules, "homeassistant.components.recorder", fake_recorder)
     monkeypatch.setitem(
@@ -2926,6 +3216,282 @@ async def test_transport_cost_lookup_refreshes_fallback_when_current_cost_change
     assert lookup[0]["cost"] == pytest.approx(0.07)
 
 
+@pytest.mark.asyncio
+async def test_transport_cost_lookup_orders_out_of_order_history(
+    fake_hass, monkeypatch
+):
+    """History rows are only re-sorted when they arrive out of order."""
+    base_time = datetime(2025, 1, 8, 12, 0, tzinfo=timezone.utc)
+    _freeze_time(monkeypatch, base_time)
+
+    config = _base_config()
+    config[CONF_TRANSPORT_COST_ENTITY] = "sensor.transport_cost"
+    coordinator = _create_coordinator(fake_hass, config, monkeypatch)
+
+    def fake_history(hass, start_time, end_time, entities, **kwargs):
+        return {
+            "sensor.transport_cost": [
+                SimpleNamespace(
+                    state="0.08",
+                    last_changed=datetime(2025, 1, 7, 6, 0, tzinfo=timezone.utc),
+                ),
+                SimpleNamespace(
+                    state="0.05",
+                    last_changed=datetime(2025, 1, 6, 0, 0, tzinfo=timezone.utc),
+                ),
+            ]
+        }
+
+    _install_fake_recorder(monkeypatch, fake_history)
+
+    lookup, status = await coordinator._get_transport_cost_lookup(0.08)
+
+    assert status == "applied"
+    assert [change["cost"] for change in lookup] == pytest.approx([0.05, 0.08])
+
+
+@pytest.mark.asyncio
+async def test_transport_cost_lookup_collapses_stutter_and_float_noise(
+    fake_hass, monkeypatch
+):
+    """Sub-minute flips and sub-1e-6 cost noise do not add lookup entries."""
+    base_time = datetime(2025, 1, 8, 12, 0, tzinfo=timezone.utc)
+    _freeze_time(monkeypatch, base_time)
+
+    config = _base_config()
+    config[CONF_TRANSPORT_COST_ENTITY] = "sensor.transport_cost"
+    coordinator = _create_coordinator(fake_hass, config, monkeypatch)
+
+    def row(state, hour, minute=0, second=0):
+        return SimpleNamespace(
+            state=state,
+            last_changed=datetime(
+                2025, 1, 7, hour, minute, second, tzinfo=timezone.utc
+            ),
+        )
+
+    def fake_history(hass, start_time, end_time, entities, **kwargs):
+        return {
+            "sensor.transport_cost": [
+                row("0.05", 0),
+                row("0.08", 6),
+                row("0.05", 6, 0, 20),
+                row("0.08", 8),
+                row("0.09", 9),
+                row("0.10", 9, 0, 30),
+                row("0.1000004", 10),
+            ]
+        }
+
+    _install_fake_recorder(monkeypatch, fake_history)
+
+    lookup, status = await coordinator._get_transport_cost_lookup(0.10)
+
+    assert status == "applied"
+    assert [change["cost"] for change in lookup] == pytest.approx([0.05, 0.08, 0.10])
+    assert [change["start"] for change in lookup] == [
+        datetime(2025, 1, 7, hour, tzinfo=timezone.utc).timestamp()
+        for hour in (0, 8, 9)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_transport_cost_lookup_shares_rebuild_between_overlapping_refreshes(
+    fake_hass, monkeypatch
+):
+    """Concurrent lookups wait for one recorder read instead of racing."""
+    base_time = datetime(2025, 1, 8, 12, 0, tzinfo=timezone.utc)
+    _freeze_time(monkeypatch, base_time)
+
+    config = _base_config()
+    config[CONF_TRANSPORT_COST_ENTITY] = "sensor.transport_cost"
+    coordinator = _create_coordinator(fake_hass, config, monkeypatch)
+    history_calls = []
+
+    def fake_history(hass, start_time, end_time, entities, **kwargs):
+        history_calls.append(start_time)
+        return {
+            "sensor.transport_cost": [
+                SimpleNamespace(
+                    state="0.05",
+                    last_changed=datetime(2025, 1, 6, 0, 0, tzinfo=timezone.utc),
+                )
+            ]
+        }
+
+    async def slow_executor_job(func, *args, **kwargs):
+        await asyncio.sleep(0)
+        return func(*args, **kwargs)
+
+    _install_fake_recorder(monkeypatch, fake_history)
+    monkeypatch.setattr(fake_hass, "async_add_executor_job", slow_executor_job)
+
+    first, second = await asyncio.gather(
+        coordinator._get_transport_cost_lookup(0.05),
+        coordinator._get_transport_cost_lookup(0.05),
+    )
+
+    assert len(history_calls) == 1
+    assert first[1] == second[1] == "applied"
+    assert second[0] is first[0]
+
+
+@pytest.mark.asyncio
+async def test_transport_cost_lookup_keeps_richer_cached_history(
+    fake_hass, monkeypatch
+):
+    """A degenerate history read must not replace a fuller cached lookup."""
+    base_time = datetime(2025, 1, 8, 12, 0, tzinfo=timezone.utc)
+    _freeze_time(monkeypatch, base_time)
+
+    config = _base_config()
+    config[CONF_TRANSPORT_COST_ENTITY] = "sensor.transport_cost"
+    coordinator = _create_coordinator(fake_hass, config, monkeypatch)
+
+    history = [
+        SimpleNamespace(
+            state="0.05", last_changed=datetime(2025, 1, 6, 0, 0, tzinfo=timezone.utc)
+        ),
+        SimpleNamespace(
+            state="0.08", last_changed=datetime(2025, 1, 7, 6, 0, tzinfo=timezone.utc)
+        ),
+    ]
+
+    def fake_history(hass, start_time, end_time, entities, **kwargs):
+        return {"sensor.transport_cost": list(history)}
+
+    _install_fake_recorder(monkeypatch, fake_history)
+
+    full_lookup, status = await coordinator._get_transport_cost_lookup(0.08)
+    assert status == "applied"
+    assert len(full_lookup) == 2
+
+    del history[0]
+    coordinator._transport_cost_lookup_time = None
+
+    lookup, status = await coordinator._get_transport_cost_lookup(0.08)
+    assert status == "applied"
+    assert lookup is full_lookup
+
+
+@pytest.mark.asyncio
+async def test_transport_cost_lookup_appends_live_change_without_recorder(
+    fake_hass, monkeypatch
+):
+    """A live change after the cached history extends it without a DB read."""
+    base_time = datetime(2025, 1, 8, 12, 0, tzinfo=timezone.utc)
+    _freeze_time(monkeypatch, base_time)
+
+    config = _base_config()
+    config[CONF_TRANSPORT_COST_ENTITY] = "sensor.transport_cost"
+    coordinator = _create_coordinator(fake_hass, config, monkeypatch)
+    history_calls = []
+
+    def fake_history(hass, start_time, end_time, entities, **kwargs):
+        history_calls.append(start_time)
+        return {
+            "sensor.transport_cost": [
+                SimpleNamespace(
+                    state="0.05",
+                    last_changed=datetime(2025, 1, 6, 0, 0, tzinfo=timezone.utc),
+                ),
+                SimpleNamespace(
+                    state="0.08",
+                    last_changed=datetime(2025, 1, 7, 6, 0, tzinfo=timezone.utc),
+                ),
+            ]
+        }
+
+    _install_fake_recorder(monkeypatch, fake_history)
+
+    first_lookup, status = await coordinator._get_transport_cost_lookup(0.08)
+    assert status == "applied"
+    assert len(history_calls) == 1
+
+    changed_at = base_time + timedelta(minutes=5)
+    fake_hass.states._states["sensor.transport_cost"] = SimpleNamespace(
+        state="0.10", last_changed=changed_at
+    )
+    _freeze_time(monkeypatch, base_time + timedelta(minutes=10))
+
+    lookup, status = await coordinator._get_transport_cost_lookup(0.10)
+
+    assert status == "applied"
+    assert len(history_calls) == 1
+    assert lookup is not first_lookup
+    assert [change["cost"] for change in lookup] == pytest.approx([0.05, 0.08, 0.10])
+    assert lookup[-1]["start"] == changed_at.timestamp()
+    assert coordinator._transport_cost_lookup is lookup
+
+
+def test_transport_cost_lookup_ttl_adapts_to_history_stability(
+    fake_hass, monkeypatch
+):
+    """Stable history stretches the refresh TTL; changed history shrinks it."""
+    coordinator = _create_coordinator(fake_hass, _base_config(), monkeypatch)
+    resolver = coordinator._transport_cost_resolver
+    stable = [{"start": "2025-01-01T00:00:00+00:00", "cost": 0.05}]
+    changed = stable + [{"start": "2025-01-01T06:00:00+00:00", "cost": 0.08}]
+
+    resolver._adapt_ttl(stable)
+    assert coordinator._transport_cost_ttl == timedelta(minutes=30)
+
+    for _ in range(5):
+        resolver._adapt_ttl(stable)
+    assert coordinator._transport_cost_ttl == timedelta(hours=6)
+
+    resolver._adapt_ttl(changed)
+    assert coordinator._transport_cost_ttl == timedelta(hours=3)
+
+    resolver._reset_ttl()
+    assert coordinator._transport_cost_ttl == timedelta(minutes=30)
+    assert coordinator._transport_cost_lookup_signature is None
+
+
+@pytest.mark.asyncio
+async def test_transport_cost_lookup_ttl_grows_with_sliding_window_start(
+    fake_hass, monkeypatch
+):
+    """The recorder's window-start row moving forward is not a history change."""
+    base_time = datetime(2025, 1, 8, 12, 0, tzinfo=timezone.utc)
+    _freeze_time(monkeypatch, base_time)
+
+    config = _base_config()
+    config[CONF_TRANSPORT_COST_ENTITY] = "sensor.transport_cost"
+    coordinator = _create_coordinator(fake_hass, config, monkeypatch)
+    history_calls = []
+
+    def fake_history(hass, start_time, end_time, entities, **kwargs):
+        history_calls.append(start_time)
+        return {
+            "sensor.transport_cost": [
+                # Recorder stamps the state in force at the window start with
+                # the start time itself.
+                SimpleNamespace(state="0.05", last_changed=start_time),
+                SimpleNamespace(
+                    state="0.08",
+                    last_changed=datetime(2025, 1, 7, 6, 0, tzinfo=timezone.utc),
+                ),
+            ]
+        }
+
+    _install_fake_recorder(monkeypatch, fake_history)
+
+    await coordinator._get_transport_cost_lookup(0.08)
+    assert coordinator._transport_cost_ttl == timedelta(minutes=30)
+
+    _freeze_time(monkeypatch, base_time + timedelta(minutes=31))
+    await coordinator._get_transport_cost_lookup(0.08)
+    assert coordinator._transport_cost_ttl == timedelta(hours=1)
+
+    _freeze_time(monkeypatch, base_time + timedelta(minutes=92))
+    await coordinator._get_transport_cost_lookup(0.08)
+
+    assert len(history_calls) == 3
+    assert history_calls[0] != history_calls[2]
+    assert coordinator._transport_cost_ttl == timedelta(hours=2)
+
+
 def test_resolve_transport_cost_matches_local_week_across_dst(fake_hass, monkeypatch):
     """Weekly transport matching should reuse the same local tariff slot across DST."""
     base_time = datetime(2026, 4, 4, 12, 0, tzinfo=timezone.utc)
@@ -3199,8 +3765,7 @@ async def test_solar_forecast_before_start_hour_uses_today_entity(
     assert coordinator._solar_forecast_source == "today_live"
 
 
-@pytest.mark.asyncio
-async def test_get_state_value_parses_localized_or_unit_appended_numbers(
+def test_get_state_value_parses_localized_or_unit_appended_numbers(
     fake_hass, monkeypatch
 ):
     """Numeric parsing should tolerate decimal comma and unit suffixes."""
@@ -3209,13 +3774,30 @@ async def test_get_state_value_parses_localized_or_unit_appended_numbers(
     fake_hass.states.set("sensor.localized_value", "13,239")
     fake_hass.states.set("sensor.unit_appended_value", "11.7 kWh")
 
-    localized = await coordinator._get_state_value("sensor.localized_value")
-    with_unit = await coordinator._get_state_value("sensor.unit_appended_value")
+    localized = coordinator._get_state_value("sensor.localized_value")
+    with_unit = coordinator._get_state_value("sensor.unit_appended_value")
 
     assert localized == pytest.approx(13.239)
     assert with_unit == pytest.approx(11.7)
 
 
+def test_get_state_value_reuses_parse_until_state_is_updated(fake_hass, monkeypatch):
+    coordinator = _create_coordinator(fake_hass, _base_config(), monkeypatch)
+    state = SimpleNamespace(state="12.5", last_updated_timestamp=100.0)
+    fake_hass.states._states["sensor.slow_value"] = state
+
+    assert coordinator._get_state_value("sensor.slow_value") == pytest.approx(12.5)
+
+    # Same last_updated: the cached parse is returned.
+    state.state = "99"
+    assert coordinator._get_state_value("sensor.slow_value") == pytest.approx(12.5)
+
+    fake_hass.states._states["sensor.slow_value"] = SimpleNamespace(
+        state="13,5", last_updated_timestamp=200.0
+    )
+    assert coordinator._get_state_value("sensor.slow_value") == pytest.approx(13.5)
+
+
 @pytest.mark.asyncio
 async def test_solar_forecast_before_start_hour_uses_cache_when_no_today(
     fake_hass, monkeypatch
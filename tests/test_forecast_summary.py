@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import timedelta
 
+import pytest
 from homeassistant.util import dt as dt_util
 
 from custom_components.electricity_planner.const import CONF_MIN_CAR_CHARGING_DURATION
@@ -18,6 +19,7 @@ class _Coordinator:
         self._last_price_timeline = timeline
         self._last_price_timeline_generated_at = None
         self._last_price_timeline_data_hash = None
+        self._last_price_timeline_inputs = None
         self._price_timeline_max_age = timedelta(hours=1)
         self.build_calls = 0
 
@@ -57,7 +59,7 @@ def test_forecast_summary_builds_and_caches_best_window():
     assert summary["available"] is True
     assert summary["cheapest_interval_price"] == 0.1
     assert summary["best_window_hours"] == 2
-    assert summary["best_window_average_price"] == 0.15
+    assert summary["best_window_average_price"] == pytest.approx(0.15)
     assert summary["average_threshold"] == 0.25
     assert "timeline_generated_at" in summary
     assert coordinator.build_calls == 1
@@ -129,6 +131,34 @@ def test_forecast_summary_invalidates_cache_when_price_hash_changes():
     assert coordinator._last_price_timeline == rebuilt
 
 
+def test_forecast_summary_reuses_cache_for_identical_inputs_without_hashing():
+    now = dt_util.utcnow()
+    cached = [(now, now + timedelta(hours=1), 0.20)]
+    prices_today = {"raw_today": [3]}
+    coordinator = _Coordinator(timeline=cached)
+    coordinator._last_price_timeline_generated_at = now
+    coordinator._last_price_timeline_data_hash = "built-by-charging-window"
+    coordinator._last_price_timeline_inputs = (prices_today, None, None, None)
+    coordinator.config = {CONF_MIN_CAR_CHARGING_DURATION: 1}
+
+    def _fail_hash(*_args):
+        raise AssertionError("hash should not be recomputed for identical inputs")
+
+    coordinator._compute_price_data_hash = _fail_hash
+
+    summary = ForecastSummaryCalculator(coordinator).calculate(
+        prices_today=prices_today,
+        prices_tomorrow=None,
+        transport_lookup=None,
+        current_transport_cost=None,
+        minimum_average_threshold=None,
+    )
+
+    assert summary["available"] is True
+    assert summary["cheapest_interval_price"] == 0.2
+    assert coordinator.build_calls == 0
+
+
 def test_find_best_window_returns_none_for_gap_shorter_than_duration():
     now = dt_util.utcnow()
     future_segments = [(now, now + timedelta(minutes=30), 0.1)]
@@ -139,3 +169,20 @@ def test_find_best_window_returns_none_for_gap_shorter_than_duration():
         )
         is None
     )
+
+
+def test_future_segments_bisects_sorted_timeline_and_handles_overlap():
+    now = dt_util.utcnow()
+    calculator = ForecastSummaryCalculator(_Coordinator())
+    timeline = [
+        (now - timedelta(hours=2), now - timedelta(hours=1), 0.1),
+        (now - timedelta(hours=1), now, 0.2),
+        (now, now + timedelta(hours=1), 0.3),
+    ]
+    assert calculator._future_segments(timeline, now) == timeline[2:]
+
+    overlapping = [
+        (now - timedelta(hours=2), now + timedelta(hours=1), 0.1),
+        (now - timedelta(hours=1), now, 0.2),
+    ]
+    assert calculator._future_segments(overlapping, now) == overlapping[:1]
@@ -258,3 +258,75 @@ def test_info_release_notes_link_matches_existing_file():
         "[Releases](https://github.com/emavap/electricity_planner/releases)"
         in info_content
     ), "info.md should link to the GitHub releases page"
+
+
+def test_primary_area_intervals_returns_first_area_list():
+    intervals = [{"start": "2025-01-01T00:00:00+00:00", "value": 100}]
+
+    assert helpers.primary_area_intervals({"NL": intervals, "BE": []}) is intervals
+    assert helpers.primary_area_intervals({"NL": "not-a-list"}) == []
+    assert helpers.primary_area_intervals({}) == []
+    assert helpers.primary_area_intervals(None) == []
+
+
+def test_exc_info_throttle_allows_one_traceback_per_interval(monkeypatch):
+    clock = iter([0, 10_000_000_000, 61_000_000_000])
+    monkeypatch.setattr(helpers.time, "monotonic_ns", lambda: next(clock))
+    throttle = helpers.ExcInfoThrottle(60)
+
+    assert throttle.allow() is True
+    assert throttle.allow() is False
+    assert throttle.allow() is True
+
+
+def test_isoformat_local_follows_time_zone_changes():
+    instant = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+    original_zone = helpers.dt_util.DEFAULT_TIME_ZONE
+    try:
+        helpers.dt_util.set_default_time_zone(helpers.dt_util.get_time_zone("UTC"))
+        assert helpers.isoformat_local(instant) == "2025-01-01T12:00:00+00:00"
+
+        helpers.dt_util.set_default_time_zone(
+            helpers.dt_util.get_time_zone("Europe/Brussels")
+        )
+        assert helpers.isoformat_local(instant) == "2025-01-01T13:00:00+01:00"
+    finally:
+        helpers.dt_util.set_default_time_zone(original_zone)
+
+
+def test_transport_cost_columns_sort_and_fall_back():
+    lookup = [
+        {"start": 200.0, "cost": 0.2},
+        {"start": "1970-01-01T00:01:40+00:00", "cost": 0.1},
+        {"start": None, "cost": 0.05},
+        {"start": 300.0, "cost": None},
+    ]
+    columns = helpers.transport_cost_columns(lookup)
+
+    assert columns.starts == [100.0, 200.0]
+    assert columns.costs == [0.1, 0.2]
+    assert columns.cost_at(50.0) == 0.05
+    assert columns.cost_at(150.0) == 0.1
+    assert columns.cost_at(500.0) == 0.2
+    assert helpers.transport_cost_columns(lookup) is columns
+
+
+def test_nordpool_price_columns_sort_skip_and_cache():
+    prices = {
+        "BE": [
+            {"start": "2025-10-14T09:00:00+00:00", "value": 120.0},
+            {"start": "2025-10-14T08:00:00+00:00", "value": "100.5"},
+            {"start": None, "value": 90.0},
+            {"start": "2025-10-14T10:00:00+00:00", "value": None},
+        ],
+        "NL": [{"start": "2025-10-14T07:00:00+00:00", "value": 1.0}],
+    }
+    columns = helpers.nordpool_price_columns(prices)
+
+    assert columns.starts == [
+        datetime(2025, 10, 14, 8, tzinfo=timezone.utc),
+        datetime(2025, 10, 14, 9, tzinfo=timezone.utc),
+    ]
+    assert columns.prices == [100.5, 120.0]
+    assert helpers.nordpool_price_columns(prices) is columns
+    assert helpers.nordpool_price_columns(None) == ([], [], [])
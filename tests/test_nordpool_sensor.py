@@ -680,8 +680,8 @@ def test_extra_state_attributes_skips_invalid_intervals(fake_coordinator, fake_e
     assert attrs["transport_cost_applied"] is None
 
 
-def test_resolve_transport_cost_uses_pre_parsed_local_when_present(monkeypatch):
-    """Pre-parsed ``_local`` field bypasses ``parse_datetime`` on the hot path."""
+def test_resolve_transport_cost_compares_epoch_starts_without_parsing(monkeypatch):
+    """Epoch-float ``start`` values bypass ``parse_datetime`` on the hot path."""
     from datetime import datetime, timezone
 
     from custom_components.electricity_planner.helpers import _parse_datetime_cached
@@ -718,25 +718,21 @@ def test_resolve_transport_cost_uses_pre_parsed_local_when_present(monkeypatch):
     assert raw_result == pytest.approx(0.05)
     assert raw_parse_calls > 0  # Raw lookup forces parsing.
 
-    pre_parsed_lookup = [
+    epoch_lookup = [
         {
-            "start": "2099-06-01T02:00:00+00:00",
+            "start": datetime(2099, 6, 1, 2, 0, tzinfo=timezone.utc).timestamp(),
             "cost": 0.03,
-            "_local": dt_util.as_local(datetime(2099, 6, 1, 2, 0, tzinfo=timezone.utc)),
         },
         {
-            "start": "2099-06-01T13:00:00+00:00",
+            "start": datetime(2099, 6, 1, 13, 0, tzinfo=timezone.utc).timestamp(),
             "cost": 0.05,
-            "_local": dt_util.as_local(
-                datetime(2099, 6, 1, 13, 0, tzinfo=timezone.utc)
-            ),
         },
     ]
     parse_calls["count"] = 0
-    pre_parsed_result = resolve_transport_cost_from_lookup(
-        pre_parsed_lookup, target, reference_now=reference_now
+    epoch_result = resolve_transport_cost_from_lookup(
+        epoch_lookup, target, reference_now=reference_now
     )
-    assert pre_parsed_result == pytest.approx(0.05)
+    assert epoch_result == pytest.approx(0.05)
     assert parse_calls["count"] == 0  # Hot path no longer calls parse_datetime.
 
 
@@ -770,3 +766,31 @@ def test_parse_datetime_cached_skips_redundant_parses(monkeypatch):
     # ``None`` short-circuits without invoking the parser.
     assert parse_datetime_cached(None) is None
     assert parse_calls["count"] == 1
+
+
+def test_parse_datetime_utc_cached_keys_naive_strings_on_time_zone(monkeypatch):
+    """Naive strings are re-converted when Home Assistant's zone changes."""
+    from datetime import datetime, timezone
+
+    from custom_components.electricity_planner.helpers import (
+        parse_datetime_utc_cached,
+    )
+
+    original_zone = dt_util.DEFAULT_TIME_ZONE
+    try:
+        dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+        assert parse_datetime_utc_cached("2099-07-16T08:30:00") == datetime(
+            2099, 7, 16, 8, 30, tzinfo=timezone.utc
+        )
+
+        dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Brussels"))
+        assert parse_datetime_utc_cached("2099-07-16T08:30:00") == datetime(
+            2099, 7, 16, 6, 30, tzinfo=timezone.utc
+        )
+    finally:
+        dt_util.set_default_time_zone(original_zone)
+
+    assert parse_datetime_utc_cached("2099-07-16T08:30:00+02:00") == datetime(
+        2099, 7, 16, 6, 30, tzinfo=timezone.utc
+    )
+    assert parse_datetime_utc_cached(None) is None
@@ -498,7 +498,7 @@ def test_forecast_and_data_availability_sensors():
         {
             "forecast_summary": {
                 "available": True,
-                "cheapest_interval_price": 0.01,
+                "cheapest_interval_price": 0.0123456,
                 "window_count": 3,
             }
         },
@@ -508,8 +508,14 @@ def test_forecast_and_data_availability_sensors():
     )
 
     forecast = ForecastInsightsSensor(coordinator, entry)
-    assert forecast.native_value == 0.01
+    assert forecast.native_value == 0.0123
     assert forecast.extra_state_attributes["window_count"] == 3
+    assert forecast.extra_state_attributes["cheapest_interval_price"] == 0.0123
+
+    diagnostics = DecisionDiagnosticsSensor(coordinator, entry)
+    diagnostics_summary = diagnostics.extra_state_attributes["forecast_summary"]
+    assert diagnostics_summary["cheapest_interval_price"] == 0.0123
+    assert coordinator.data["forecast_summary"]["cheapest_interval_price"] == 0.0123456
 
     availability = DataAvailabilitySensor(coordinator, entry)
     assert availability.native_value == 0